@@ -2,9 +2,17 @@
 
 import time
 import re
+import csv
+import gzip
+import json
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
 from typing import List, Dict, Optional
 import pandas as pd
+import requests
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
@@ -16,6 +24,68 @@ import glob
 import hashlib
 import logging
 
+# За async HTTP скрепирање (побрзо од Selenium за статички страници)
+try:
+    import aiohttp
+
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
+
+try:
+    import lxml.html
+
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+# За Feather/Arrow запишување
+try:
+    import pyarrow as pa
+    import pyarrow.feather
+
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# orjson е ~3-5x побрз од stdlib json за енкодирање
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+# Клучни зборови за бесплатни настани - споделени помеѓу
+# Selenium и async патеката
+FREE_KEYWORDS = [
+    'бесплатно', 'free', 'без надомест', 'бесплатен влез',
+    'no cost', 'без плаќање', 'бесплатна регистрација'
+]
+
+# Фиксна шема на event полињата - зачувувањето гради колони директно
+# наместо pandas да unionира клучеви и да подредува по ред
+FIELDS = (
+    'event_id', 'url', 'title', 'date_start', 'time_start',
+    'location', 'location_full', 'ticket_url', 'ticket_price_text',
+    'ticket_price_numeric', 'ticket_free', 'description',
+    'description_full', 'category', 'organizer', 'duration',
+    'image_url', 'contact_info', 'scraped_at'
+)
+
+# Regex шаблони за цени во чист текст
+PRICE_TEXT_PATTERNS = [
+    r'(?:цена|price|cost|билет)[\s:]*(\d+(?:[,.]?\d+)?)\s*(?:ден|mkd|евра?|eur|€|\$)',
+    r'(\d+(?:[,.]?\d+)?)\s*(?:ден|mkd|евра?|eur|€|\$)(?:\s*(?:за билет|per ticket|цена))?',
+    r'(?:регистрација|registration)[\s:]*(\d+(?:[,.]?\d+)?)\s*(?:ден|mkd|евра?|eur|€|\$)',
+    r'(?:влез|entrance|admission)[\s:]*(\d+(?:[,.]?\d+)?)\s*(?:ден|mkd|евра?|eur|€|\$)'
+]
+
 
 class ITEventsScraper:
     """
@@ -42,6 +112,10 @@ class ITEventsScraper:
         os.makedirs(self.raw_data_dir, exist_ok=True)
         os.makedirs(self.processed_data_dir, exist_ok=True)
 
+        # Кеширана Path резолуција на output папката - се користи при
+        # секое зачувување наместо повторен os.path.join
+        self._out_dir = Path(self.processed_data_dir)
+
     def clean_old_files(self):
         """Отстрани стари фајлови"""
         old_raw_files = glob.glob(os.path.join(self.raw_data_dir, "it_events_raw_*.csv"))
@@ -63,8 +137,17 @@ class ITEventsScraper:
         chrome_options.add_argument("--disable-extensions")
         chrome_options.add_argument("--disable-plugins")
         chrome_options.add_argument("--disable-images")  # Побрзо вчитување
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
+
+        # 'eager' - DOMContentLoaded е доволен за текст екстракција,
+        # не чекаме слики/фонтови да се симнат
+        chrome_options.page_load_strategy = 'eager'
+        chrome_options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.managed_default_content_settings.stylesheets': 2,
+        })
         chrome_options.add_argument(
             "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
         )
@@ -324,12 +407,7 @@ class ITEventsScraper:
             page_text = self.driver.find_element(By.TAG_NAME, "body").text.lower()
 
             # Провери за бесплатни настани
-            free_keywords = [
-                'бесплатно', 'free', 'без надомест', 'бесплатен влез',
-                'no cost', 'без плаќање', 'бесплатна регистрација'
-            ]
-
-            for keyword in free_keywords:
+            for keyword in FREE_KEYWORDS:
                 if keyword in page_text:
                     price_info['ticket_price_text'] = 'Бесплатно'
                     price_info['ticket_free'] = True
@@ -359,14 +437,7 @@ class ITEventsScraper:
                     continue
 
             # Пребарувај со regex низ целиот текст
-            price_patterns = [
-                r'(?:цена|price|cost|билет)[\s:]*(\d+(?:[,.]?\d+)?)\s*(?:ден|mkd|евра?|eur|€|\$)',
-                r'(\d+(?:[,.]?\d+)?)\s*(?:ден|mkd|евра?|eur|€|\$)(?:\s*(?:за билет|per ticket|цена))?',
-                r'(?:регистрација|registration)[\s:]*(\d+(?:[,.]?\d+)?)\s*(?:ден|mkd|евра?|eur|€|\$)',
-                r'(?:влез|entrance|admission)[\s:]*(\d+(?:[,.]?\d+)?)\s*(?:ден|mkd|евра?|eur|€|\$)'
-            ]
-
-            for pattern in price_patterns:
+            for pattern in PRICE_TEXT_PATTERNS:
                 matches = re.findall(pattern, page_text, re.IGNORECASE)
                 if matches:
                     # Земи ја првата цена што ја најде
@@ -448,6 +519,241 @@ class ITEventsScraper:
                 return 'MKD'
             else:  # Веројатно евра
                 return 'EUR'
+    def _price_info_from_text(self, page_text: str) -> Dict:
+        """Извлечи информации за цена само од чист текст (без driver)
+
+        Споделена логика помеѓу Selenium и async патеката.
+        """
+        price_info = {
+            'ticket_price_text': '',
+            'ticket_free': True,
+            'ticket_price_numeric': None
+        }
+
+        for keyword in FREE_KEYWORDS:
+            if keyword in page_text:
+                price_info['ticket_price_text'] = 'Бесплатно'
+                return price_info
+
+        for pattern in PRICE_TEXT_PATTERNS:
+            matches = re.findall(pattern, page_text, re.IGNORECASE)
+            if matches:
+                price_num = matches[0].replace(',', '.')
+                try:
+                    price_numeric = float(price_num)
+                    currency = self.detect_currency_from_context(page_text, price_num)
+                    price_info['ticket_price_text'] = f"{price_num} {currency}"
+                    price_info['ticket_free'] = False
+                    price_info['ticket_price_numeric'] = price_numeric
+                    return price_info
+                except ValueError:
+                    continue
+
+        return price_info
+
+    async def _fetch(self, session, url: str, semaphore, retries: int = 3) -> str:
+        """Async fetch со retry и exponential backoff"""
+        for attempt in range(retries):
+            try:
+                async with semaphore:
+                    async with session.get(url) as response:
+                        if response.status == 429:
+                            retry_after = float(response.headers.get('Retry-After', 2 ** attempt))
+                            await asyncio.sleep(retry_after)
+                            continue
+                        if response.status >= 400:
+                            return ""
+                        return await response.text()
+            except Exception as e:
+                if attempt == retries - 1:
+                    self.logger.debug(f"Fetch не успеа за {url}: {e}")
+                    return ""
+                await asyncio.sleep(2 ** attempt)
+        return ""
+
+    def _extract_events_from_listing_html(self, html: str) -> List[Dict]:
+        """Извлечи основни податоци од статичкиот HTML на listing страница"""
+        events = []
+        tree = lxml.html.fromstring(html)
+
+        for article in tree.xpath("//article"):
+            links = article.xpath(".//a[contains(@href, 'it-nastan')]")
+            if not links:
+                continue
+
+            event_data = {
+                'event_id': '',
+                'url': links[0].get('href', ''),
+                'title': '',
+                'date_start': '',
+                'time_start': '',
+                'location': '',
+                'ticket_url': '',
+                'ticket_price_text': '',
+                'ticket_free': True,
+                'description': '',
+                'category': 'IT Event',
+                'organizer': '',
+                'duration': '',
+                'image_url': '',
+                'scraped_at': datetime.now().isoformat()
+            }
+            event_data['ticket_url'] = event_data['url']
+
+            # Наслов - од heading/title елемент или од самиот линк
+            for title_el in article.xpath(
+                    ".//h1 | .//h2 | .//h3 | .//*[contains(@class, 'title')]"):
+                text = title_el.text_content().strip()
+                if len(text) > 3:
+                    event_data['title'] = text.split('\n')[0].strip()
+                    break
+            if not event_data['title']:
+                event_data['title'] = links[0].text_content().strip()
+
+            # Датум
+            for date_el in article.xpath(".//time | .//*[contains(@class, 'date')]"):
+                date = date_el.text_content().strip() or date_el.get('datetime', '')
+                if date:
+                    event_data['date_start'] = date.strip()
+                    break
+
+            if event_data['title']:
+                event_data['event_id'] = self.generate_event_id(
+                    event_data['title'],
+                    event_data['date_start']
+                )
+                event_data['description'] = f"IT настан: {event_data['title']}"
+                events.append(event_data)
+
+        return events
+
+    def _merge_static_details(self, event: Dict, html: str):
+        """Мерџирај детали од статичкиот HTML на детална страница"""
+        tree = lxml.html.fromstring(html)
+
+        # Опис - од content елементите
+        for xpath in ("//*[contains(@class, 'entry-content')]",
+                      "//*[contains(@class, 'post-content')]",
+                      "//article"):
+            nodes = tree.xpath(xpath)
+            if nodes:
+                desc_text = re.sub(r'\s+', ' ', nodes[0].text_content()).strip()
+                if len(desc_text) > 50:
+                    event['description'] = desc_text
+                    break
+
+        # Слика
+        for img_src in tree.xpath(
+                "//*[contains(@class, 'post-thumbnail')]//img/@src | //article//img/@src"):
+            if img_src.startswith('http'):
+                event['image_url'] = img_src
+                break
+
+        # Цена - од целиот текст на страницата
+        page_text = tree.text_content().lower()
+        event.update(self._price_info_from_text(page_text))
+
+    def _scrape_threaded(self, max_pages: int) -> List[Dict]:
+        """Паралелно скрепирање со ThreadPoolExecutor + requests.Session
+
+        Fallback кога aiohttp не е достапен - I/O-bound fetches се
+        преклопуваат преку 16 worker threads, семафорот ја ограничува
+        конкурентноста кон сајтот. Selenium драјверите не смеат да се
+        делат меѓу threads, па овде се користи чист HTTP.
+        """
+        session = requests.Session()
+        session.headers.update({'User-Agent': USER_AGENT})
+        rate_limiter = threading.Semaphore(16)
+
+        def fetch_page(url: str) -> str:
+            with rate_limiter:
+                try:
+                    response = session.get(url, timeout=15)
+                    if response.status_code >= 400:
+                        return ""
+                    return response.text
+                except Exception as e:
+                    self.logger.debug(f"Fetch не успеа за {url}: {e}")
+                    return ""
+
+        # Фаза 1: listing страници
+        page_urls = [self.it_nastan_url]
+        page_urls += [f"{self.it_nastan_url}page/{n}/" for n in range(2, max_pages + 1)]
+
+        self.logger.info(f"🧵 Threaded fetch на {len(page_urls)} listing страници...")
+        all_events = []
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            for html in executor.map(fetch_page, page_urls):
+                if html:
+                    all_events.extend(self._extract_events_from_listing_html(html))
+
+        self.logger.info(f"✅ ФАЗА 1 завршена: Собрани {len(all_events)} настани")
+
+        unique_events = self.remove_duplicates(all_events)
+        self.logger.info(f"🧹 После отстранување дупликати: {len(unique_events)} уникатни настани")
+
+        # Фаза 2: детални страници
+        self.logger.info(f"🎬 === ФАЗА 2: Детални податоци за {len(unique_events)} настани ===")
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            detail_htmls = list(executor.map(
+                lambda e: fetch_page(e['url']) if e.get('url') else "",
+                unique_events))
+
+        for event, html in zip(unique_events, detail_htmls):
+            if html:
+                try:
+                    self._merge_static_details(event, html)
+                except Exception as e:
+                    self.logger.error(f"    ❌ Грешка при парсирање детали: {e}")
+
+        self.logger.info(f"✅ ФАЗА 2 завршена: {len(unique_events)} настани со детали")
+        return unique_events
+
+    async def _scrape_async(self, max_pages: int) -> List[Dict]:
+        """Async скрепирање: паралелни listing и detail fetches со aiohttp
+
+        Семафор со 64 слотови ја ограничува конкурентноста по host.
+        """
+        semaphore = asyncio.Semaphore(64)
+        timeout = aiohttp.ClientTimeout(total=15)
+        headers = {'User-Agent': USER_AGENT}
+
+        async with aiohttp.ClientSession(headers=headers, timeout=timeout) as session:
+            # Фаза 1: сите listing страници паралелно
+            page_urls = [self.it_nastan_url]
+            page_urls += [f"{self.it_nastan_url}page/{n}/" for n in range(2, max_pages + 1)]
+
+            self.logger.info(f"⚡ Async fetch на {len(page_urls)} listing страници...")
+            listing_htmls = await asyncio.gather(
+                *(self._fetch(session, url, semaphore) for url in page_urls))
+
+            all_events = []
+            for html in listing_htmls:
+                if html:
+                    all_events.extend(self._extract_events_from_listing_html(html))
+
+            self.logger.info(f"✅ ФАЗА 1 завршена: Собрани {len(all_events)} настани")
+
+            unique_events = self.remove_duplicates(all_events)
+            self.logger.info(f"🧹 После отстранување дупликати: {len(unique_events)} уникатни настани")
+
+            # Фаза 2: сите детални страници паралелно
+            self.logger.info(f"🎬 === ФАЗА 2: Детални податоци за {len(unique_events)} настани ===")
+            detail_htmls = await asyncio.gather(
+                *(self._fetch(session, event['url'], semaphore) if event.get('url')
+                  else asyncio.sleep(0, result="")
+                  for event in unique_events))
+
+        for event, html in zip(unique_events, detail_htmls):
+            if html:
+                try:
+                    self._merge_static_details(event, html)
+                except Exception as e:
+                    self.logger.error(f"    ❌ Грешка при парсирање детали: {e}")
+
+        self.logger.info(f"✅ ФАЗА 2 завршена: {len(unique_events)} настани со детали")
+        return unique_events
+
     def find_event_containers(self) -> List:
         """Најди ги сите контејнери што содржат настани"""
         container_selectors = [
@@ -726,73 +1032,252 @@ class ITEventsScraper:
         self.logger.info(f"\n✅ ФАЗА 2 завршена: {len(detailed_events)} настани со детали")
         return detailed_events
 
-    def save_to_csv(self, events: List[Dict], filename_suffix: str = "") -> str:
-        """Зачувај ги настаните во CSV"""
-        if not events:
+    def _as_dataframe(self, events: List[Dict]) -> pd.DataFrame:
+        """Изгради DataFrame по FIELDS шемата - колонарно, еден pass
+        по листата за секоја колона наместо per-row dict reshuffle"""
+        cols = {k: [e.get(k) for e in events] for k in FIELDS}
+        return pd.DataFrame(cols, columns=FIELDS, copy=False)
+
+    def save_to_csv(self, events, filename_suffix: str = "", timestamp: str = None,
+                    compress: bool = False) -> str:
+        """Зачувај ги настаните во CSV
+
+        Прифаќа листа од dicts или готов DataFrame - run_full_scrape го
+        гради DataFrame-от еднаш и го споделува со print_summary.
+        Ако timestamp не е зададен, се пресметува нов - но при целосно
+        скрепирање run_full_scrape го пресметува еднаш и го споделува,
+        па сите зачувани фајлови од еден run имаат ист timestamp.
+
+        Со compress=True се пишува .csv.gz со gzip level 1 - pandas
+        default-от (level 9) е ~5-10x побавен за пар проценти помал
+        фајл; за текстуални scraper outputs level 1 губи малку, а
+        заштедува најмногу време (за помал + побрз output подобро е
+        save_to_feather со zstd).
+        """
+        if len(events) == 0:
             self.logger.warning("Нема настани за зачувување")
             return ""
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
         if filename_suffix:
             filename = f"it_events_{filename_suffix}_{timestamp}.csv"
         else:
             filename = f"it_events_{timestamp}.csv"
+        if compress:
+            filename += ".gz"
 
-        filepath = os.path.join(self.processed_data_dir, filename)
+        filepath = str(self._out_dir / filename)
+        gzip_kwargs = {'method': 'gzip', 'compresslevel': 1, 'mtime': 0}
 
         try:
-            df = pd.DataFrame(events)
-            df.to_csv(filepath, index=False, encoding='utf-8-sig')
+            if isinstance(events, pd.DataFrame):
+                events.to_csv(filepath, index=False, encoding='utf-8-sig',
+                              compression=gzip_kwargs if compress else None)
+            else:
+                # Fast path: ако сите вредности се скалари (стринг,
+                # bool, број, None) - stdlib csv пишува директно, без
+                # pandas; event dict-овите секогаш носат bool
+                # ticket_free и нумеричка цена, па стринг-only гејт
+                # никогаш не би се погодил
+                all_scalars = all(
+                    isinstance(v, (str, bool, int, float, type(None)))
+                    for e in events for v in e.values())
+
+                if all_scalars:
+                    def cell(v):
+                        # None/NaN -> '' (`or ''` би срушило False/0)
+                        if v is None or (isinstance(v, float) and v != v):
+                            return ''
+                        return v
+
+                    if compress:
+                        f = gzip.open(filepath, 'wt', newline='',
+                                      encoding='utf-8-sig', compresslevel=1)
+                    else:
+                        f = open(filepath, 'w', newline='',
+                                 encoding='utf-8-sig', buffering=1 << 20)
+                    with f:
+                        writer = csv.writer(f)
+                        writer.writerow(FIELDS)
+                        writer.writerows(
+                            [cell(e.get(k)) for k in FIELDS] for e in events)
+                else:
+                    df = self._as_dataframe(events)
+                    df.to_csv(filepath, index=False, encoding='utf-8-sig',
+                              compression=gzip_kwargs if compress else None)
+
             self.logger.info(f"💾 Зачувани {len(events)} настани во: {filepath}")
             return filepath
         except Exception as e:
             self.logger.error(f"❌ Грешка при зачувување: {e}")
             return ""
 
-    def print_summary(self, events: List[Dict]):
-        """Прикажи резиме од скрепирањето"""
+    def save_to_jsonl(self, events: List[Dict], filename_suffix: str = "", timestamp: str = None) -> str:
+        """Зачувај ги настаните во JSONL - директно пишување без pandas
+
+        Еден ред = еден настан; append-friendly и отпорен на прекини,
+        без трошок за градење DataFrame.
+        """
         if not events:
-            self.logger.info("📊 Нема настани за приказ")
+            self.logger.warning("Нема настани за зачувување")
+            return ""
+
+        timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
+        if filename_suffix:
+            filename = f"it_events_{filename_suffix}_{timestamp}.jsonl"
+        else:
+            filename = f"it_events_{timestamp}.jsonl"
+
+        filepath = str(self._out_dir / filename)
+
+        try:
+            with open(filepath, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                for event in events:
+                    if HAS_ORJSON:
+                        f.write(orjson.dumps(event).decode())
+                    else:
+                        f.write(json.dumps(event, ensure_ascii=False))
+                    f.write('\n')
+            self.logger.info(f"💾 Зачувани {len(events)} настани во: {filepath}")
+            return filepath
+        except Exception as e:
+            self.logger.error(f"❌ Грешка при зачувување: {e}")
+            return ""
+
+    def save_to_feather(self, events, filename_suffix: str = "", timestamp: str = None) -> str:
+        """Зачувај ги настаните во Feather (zstd компресија)
+
+        Табелата секогаш се запишува како единечен chunk - ако во иднина
+        се акумулираат повеќе мали batch-еви (нпр. еден по страница),
+        combine_chunks() пред запишување спречува патолошки бавни и
+        преголеми chunked записи. Бара pyarrow; без него паѓа назад
+        на CSV.
+        """
+        if not HAS_PYARROW:
+            self.logger.warning("pyarrow не е инсталиран - зачувувам CSV наместо Feather")
+            return self.save_to_csv(events, filename_suffix, timestamp)
+
+        if len(events) == 0:
+            self.logger.warning("Нема настани за зачувување")
+            return ""
+
+        timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
+        if filename_suffix:
+            filename = f"it_events_{filename_suffix}_{timestamp}.feather"
+        else:
+            filename = f"it_events_{timestamp}.feather"
+
+        filepath = str(self._out_dir / filename)
+
+        try:
+            df = events if isinstance(events, pd.DataFrame) else self._as_dataframe(events)
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            table = table.combine_chunks()
+            pa.feather.write_feather(table, filepath, compression='zstd')
+            self.logger.info(f"💾 Зачувани {len(events)} настани во: {filepath}")
+            return filepath
+        except Exception as e:
+            self.logger.error(f"❌ Грешка при зачувување: {e}")
+            return ""
+
+    def print_summary(self, events):
+        """Прикажи резиме од скрепирањето
+
+        Прифаќа листа од dicts или готов DataFrame - со DataFrame
+        статистиките се векторизирани наместо повеќе Python passes.
+        """
+        # Целото резиме е само за INFO ниво - ако е исклучено (нпр.
+        # WARNING во продукција) прескокни го и форматирањето
+        if not self.logger.isEnabledFor(logging.INFO):
             return
 
-        self.logger.info(f"\n📊 === РЕЗИМЕ ===")
-        self.logger.info(f"Вкупно настани: {len(events)}")
+        if len(events) == 0:
+            self.logger.info("📊 Нема настани за приказ")
+            return
 
         # Статистики
-        with_description = sum(1 for e in events if e.get('description') and len(e['description']) > 50)
-        with_organizer = sum(1 for e in events if e.get('organizer'))
-        with_date = sum(1 for e in events if e.get('date_start'))
-        with_image = sum(1 for e in events if e.get('image_url'))
-
-        self.logger.info(f"Со опис: {with_description}")
-        self.logger.info(f"Со организатор: {with_organizer}")
-        self.logger.info(f"Со датум: {with_date}")
-        self.logger.info(f"Со слика: {with_image}")
-
-        # Примери
-        self.logger.info(f"\n📋 Првите 3 настани:")
-        for i, event in enumerate(events[:3]):
-            self.logger.info(f"{i + 1}. {event.get('title', 'Без наслов')}")
-            self.logger.info(f"   Датум: {event.get('date_start', 'Без датум')}")
-            self.logger.info(f"   URL: {event.get('url', 'Без URL')}")
-
-    def run_full_scrape(self, max_pages: int = 50, save_results: bool = True) -> List[Dict]:
-        """Изврши целосно скрепирање"""
-        try:
-            self.logger.info("🚀 === ЗАПОЧНУВАМ СКРЕПИРАЊЕ ===")
+        if isinstance(events, pd.DataFrame):
+            df = events
+            with_description = int((df['description'].fillna('').str.len() > 50).sum())
+            with_organizer = int(df['organizer'].fillna('').astype(bool).sum())
+            with_date = int(df['date_start'].fillna('').astype(bool).sum())
+            with_image = int(df['image_url'].fillna('').astype(bool).sum())
+            examples = df.head(3).to_dict('records')
+        else:
+            with_description = sum(1 for e in events if e.get('description') and len(e['description']) > 50)
+            with_organizer = sum(1 for e in events if e.get('organizer'))
+            with_date = sum(1 for e in events if e.get('date_start'))
+            with_image = sum(1 for e in events if e.get('image_url'))
+            examples = events[:3]
+
+        # Состави едно резиме и емитирај го со еден logger повик
+        # (наместо 9+ одделни emit-ови со lock/flush по линија)
+        lines = [
+            "\n📊 === РЕЗИМЕ ===",
+            f"Вкупно настани: {len(events)}",
+            f"Со опис: {with_description}",
+            f"Со организатор: {with_organizer}",
+            f"Со датум: {with_date}",
+            f"Со слика: {with_image}",
+            "\n📋 Првите 3 настани:",
+        ]
+        lines.extend(
+            f"{i + 1}. {event.get('title') or 'Без наслов'}\n"
+            f"   Датум: {event.get('date_start') or 'Без датум'}\n"
+            f"   URL: {event.get('url') or 'Без URL'}"
+            for i, event in enumerate(examples)
+        )
+        self.logger.info("\n".join(lines))
 
-            # Setup
-            self.setup_driver()
+    def run_full_scrape(self, max_pages: int = 50, save_results: bool = True,
+                        save_format: str = "csv") -> List[Dict]:
+        """Изврши целосно скрепирање
 
-            # Скрепирај
-            events = self.scrape_events(max_pages)
+        save_format: "csv" (default), "jsonl" за директно пишување без
+        pandas, или "feather" за компресиран Arrow output.
+        """
+        try:
+            self.logger.info("🚀 === ЗАПОЧНУВАМ СКРЕПИРАЊЕ ===")
 
-            # Зачувај ако е потребно
-            if save_results and events:
-                self.save_to_csv(events, "final")
+            # Еден timestamp за целиот run - сите зачувувања го споделуваат
+            run_ts = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-            # Прикажи резиме
-            self.print_summary(events)
+            # Пробај прво async HTTP патека - страниците на it.mk се статички,
+            # Selenium останува fallback за JS-рендерирана содржина
+            events = []
+            if HAS_AIOHTTP and HAS_LXML:
+                try:
+                    events = asyncio.run(self._scrape_async(max_pages))
+                except Exception as e:
+                    self.logger.error(f"❌ Async скрепирање не успеа: {e}")
+                    events = []
+            elif HAS_LXML:
+                try:
+                    events = self._scrape_threaded(max_pages)
+                except Exception as e:
+                    self.logger.error(f"❌ Threaded скрепирање не успеа: {e}")
+                    events = []
+
+            if not events:
+                # Selenium fallback
+                self.setup_driver()
+                events = self.scrape_events(max_pages)
+
+            # Изгради го DataFrame-от еднаш - save и summary го делат
+            if events:
+                df = self._as_dataframe(events)
+                if save_results:
+                    if save_format == "jsonl":
+                        self.save_to_jsonl(events, "final", timestamp=run_ts)
+                    elif save_format == "feather":
+                        self.save_to_feather(df, "final", timestamp=run_ts)
+                    else:
+                        # Листата (не df) за да може stdlib csv fast
+                        # path-от да се погоди; df останува за summary
+                        self.save_to_csv(events, "final", timestamp=run_ts)
+                self.print_summary(df)
+            else:
+                self.print_summary(events)
 
             self.logger.info("✅ === СКРЕПИРАЊЕТО ЗАВРШЕНО ===")
             return events
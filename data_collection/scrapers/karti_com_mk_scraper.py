@@ -1,8 +1,12 @@
 #!/usr/bin/env python3
 
+import csv
 import time
 import re
+import numpy as np
+from collections import namedtuple
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Dict, Optional
 import pandas as pd
 import selenium
@@ -29,10 +33,284 @@ except ImportError:
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
+import asyncio
+import atexit
 import os
 import glob
+import gzip
 import hashlib
 import logging
+import queue
+import shutil
+import socket
+import subprocess
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# За статичко парсирање на listing страниците без browser
+try:
+    import lxml.html
+    import cssselect  # noqa: F401 - потребен за .cssselect()
+
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+# selectolax (Modest C parser) за локално парсирање на page_source
+try:
+    from selectolax.parser import HTMLParser
+
+    HAS_SELECTOLAX = True
+except ImportError:
+    HAS_SELECTOLAX = False
+
+# Async HTTP батч за детал-страниците (thread pool-от е fallback)
+try:
+    import httpx
+
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
+# За Parquet output (df.to_parquet бара pyarrow)
+try:
+    import pyarrow  # noqa: F401
+
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Numba JIT за integer tally kernel во print_summary (опционално)
+try:
+    import numba
+
+    @numba.njit(cache=True)
+    def _count_codes(codes, num_categories):
+        out = np.zeros(num_categories, dtype=np.int64)
+        for i in range(codes.size):
+            out[codes[i]] += 1
+        return out
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+# Порта за persistent Chrome instance (remote debugging attach)
+_DEBUG_PORT = 9222
+
+# Клучни зборови за тип на настан од описот
+EVENT_TYPES = {
+    'концерт': ['концерт', 'настап', 'музика', 'пејач', 'бенд'],
+    'фестивал': ['фестивал', 'festival'],
+    'театар': ['театар', 'претстава', 'drama', 'comedy'],
+    'спорт': ['натпревар', 'фудбал', 'кошарка', 'спорт'],
+    'конференција': ['форум', 'конференција', 'семинар', 'work'],
+    'забава': ['парти', 'журка', 'party', 'dance']
+}
+
+# Aho-Corasick автомат - сите клучни зборови во еден линеарен помин
+try:
+    import ahocorasick
+
+    _EVENT_TYPE_AUTOMATON = ahocorasick.Automaton()
+    for _etype, _keywords in EVENT_TYPES.items():
+        for _kw in _keywords:
+            _EVENT_TYPE_AUTOMATON.add_word(_kw, _etype)
+    _EVENT_TYPE_AUTOMATON.make_automaton()
+except ImportError:
+    _EVENT_TYPE_AUTOMATON = None
+
+# Приоритет = редослед на декларација во EVENT_TYPES - иста логика
+# како fallback скенот без ahocorasick
+_EVENT_TYPE_PRIORITY = {_etype: _i for _i, _etype in enumerate(EVENT_TYPES)}
+
+# Македонски месеци -> број (за единечно парсирање)
+_MK_MONTHS = {
+    'Јануари': '01', 'Февруари': '02', 'Март': '03', 'Април': '04',
+    'Мај': '05', 'Јуни': '06', 'Јули': '07', 'Август': '08',
+    'Септември': '09', 'Октомври': '10', 'Ноември': '11', 'Декември': '12',
+    'јануари': '01', 'февруари': '02', 'март': '03', 'април': '04',
+    'мај': '05', 'јуни': '06', 'јули': '07', 'август': '08',
+    'септември': '09', 'октомври': '10', 'ноември': '11', 'декември': '12'
+}
+
+# Македонски месеци -> англиски (за batch pd.to_datetime)
+_MK_TO_EN = {
+    'Јануари': 'January', 'Февруари': 'February', 'Март': 'March',
+    'Април': 'April', 'Мај': 'May', 'Јуни': 'June', 'Јули': 'July',
+    'Август': 'August', 'Септември': 'September', 'Октомври': 'October',
+    'Ноември': 'November', 'Декември': 'December',
+    'јануари': 'January', 'февруари': 'February', 'март': 'March',
+    'април': 'April', 'мај': 'May', 'јуни': 'June', 'јули': 'July',
+    'август': 'August', 'септември': 'September', 'октомври': 'October',
+    'ноември': 'November', 'декември': 'December'
+}
+
+# CSS class токен -> категорија (O(1) lookup по токен)
+_CATEGORY_MAP = {
+    'concerts': 'Концерт',
+    'festivals': 'Фестивал',
+    'theater': 'Театар',
+    'sport_events': 'Спорт',
+    'philharmonic': 'Филхармонија',
+    'mob': 'Опера/Балет'
+}
+
+# Селектори за event cards - споделени помеѓу Selenium и статичката патека
+CARD_SELECTORS = [
+    "a.k_event_link",  # Од дадениот HTML
+    ".k_event_link",
+    "[class*='event-card']",
+    "[class*='event-item']",
+    ".event-container a",
+    ".events-list a"
+]
+
+# Селектори за детална страница - споделени помеѓу Selenium и HTTP
+# патеката. Подредени од најспецифични кон најопшти: првиот доволно долг
+# погодок победува, па body/main се само последна опција
+DESCRIPTION_SELECTORS = [
+    ".event-description",
+    ".event-content",
+    ".description",
+    ".event-details",
+    "[class*='description']",
+    ".entry-content",
+    "[class*='content']",
+    ".text",
+    "article",
+    ".content",
+    ".container",
+    "main",
+    "body"  # Цела страница ако е потребно
+]
+
+# Праг над кој описот се смета за комплетен (short-circuit)
+_DESCRIPTION_MIN_LEN = 200
+
+# Резултат од parse_price - без вишок клучеви во event dict/CSV шемата
+PriceInfo = namedtuple('PriceInfo', ['price_min', 'price_max', 'currency', 'ticket_free'])
+
+
+@lru_cache(maxsize=4096)
+def _event_id(clean_title: str, date: str) -> str:
+    """Хаш за event_id - мемоизиран, истиот card се јавува повеќепати
+    при пагинација пред dedup. blake2b е побрз од md5 на кратки влезови,
+    а ова не е security хаш.
+    """
+    combined = f"{clean_title}_{date}".strip('_')
+    return hashlib.blake2b(combined.encode(), digest_size=16).hexdigest()
+
+ORGANIZER_SELECTORS = [
+    ".organizer",
+    ".event-organizer",
+    ".promoter",
+    ".seller",
+    ".vendor",
+    "[class*='organizer']",
+    "[class*='promoter']",
+    ".event-info .organizer",
+    ".meta .organizer",
+    ".author"
+]
+
+TICKET_SELECTORS = [
+    ".ticket-info",
+    ".ticket-details",
+    ".price-info",
+    "[class*='ticket']",
+    "[class*='price']",
+    ".buy-ticket",
+    ".purchase"
+]
+
+# CSS поддржува запирки - сите ticket селектори во еден query
+_TICKET_SELECTOR_COMBINED = ", ".join(TICKET_SELECTORS)
+
+# Прекомпајлирани regex шаблони - компилирани еднаш при import,
+# наместо на секој повик во hot loop-овите
+_WS_RE = re.compile(r'\s+')
+_CLEAN_TITLE_RE = re.compile(r'[^\w\s]')
+_DIGITS_RE = re.compile(r'\d+')
+
+# Една алтернација со именувани групи - цени, време и контакти се вадат
+# во еден finditer помин низ описот, наместо 14 одделни прелети.
+# Редоследот е битен: опсег пред единечна цена.
+_COMBINED_RE = re.compile(
+    r'(?P<price_range>\d+[-–]\d+\s*(?:мкд|eur|usd|денари))'
+    r'|(?P<price_dual>\d+\s*(?:eur|usd)\s*/\s*\d+\s*(?:мкд|денари))'
+    r'|(?P<price_single>\d+\s*(?:мкд|eur|usd|денари))'
+    r'|(?:тел\.?|телефон|контакт)\s*:?\s*(?P<phone>\d{2,3}[-\s]*\d{3}[-\s]*\d{3,4})'
+    r'|(?P<email>[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})'
+    r'|(?P<website>www\.[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})'
+    r'|(?P<social>(?:facebook|instagram)\.com/[a-zA-Z0-9._-]+)'
+    r'|(?P<time>\d{1,2}:\d{2})',
+    re.IGNORECASE
+)
+
+_PRICE_GROUPS = ('price_range', 'price_dual', 'price_single')
+_CONTACT_GROUPS = ('phone', 'email', 'website', 'social')
+
+# Сите селектор проби за детална страница во еден browser повик -
+# секој driver.find_element е посебен JSON-over-HTTP round-trip
+_DETAIL_PROBE_JS = """
+const sels = arguments[0];
+const out = {desc: '', descSel: '', org: ''};
+for (const s of sels.desc) {
+    const e = document.querySelector(s);
+    if (e) {
+        const t = e.innerText;
+        if (t.length > arguments[1]) { out.desc = t; out.descSel = s; break; }
+        if (t.length > out.desc.length) { out.desc = t; out.descSel = s; }
+    }
+}
+for (const s of sels.org) {
+    const e = document.querySelector(s);
+    if (e) {
+        const t = e.innerText.trim();
+        if (t && t.length < 100) { out.org = t; break; }
+    }
+}
+return out;
+"""
+
+_FIND_CARDS_JS = """
+for (const s of arguments[0]) {
+    const found = document.querySelectorAll(s);
+    if (found.length) return {selector: s, cards: Array.from(found)};
+}
+return {selector: '', cards: []};
+"""
+
+# Сите полиња од сите cards во еден browser повик - инаку се по ~8
+# WebDriver round-trips по card
+_EXTRACT_CARDS_JS = """
+const text = (c, s) => { const e = c.querySelector(s); return e ? e.innerText : ''; };
+return arguments[0].map(c => ({
+    href: c.href || '',
+    title: text(c, '.k-event-list-event-title'),
+    date: text(c, '.k-events-event-date'),
+    venue: text(c, '.k-events-venue-details'),
+    cost: text(c, '.cost'),
+    img: (c.querySelector('.k-events-event-image img') || {}).src || '',
+    cls: c.className || ''
+}));
+"""
+
+# Venue/локација - обично по време, пред опис; останува одделно бидејќи
+# зависи од контекст околу совпаѓањето
+_VENUE_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'(\d{1,2}:\d{2})\s+([^А-Ш]+?)(?=[А-Ш]|$)',  # После време до прв македонски збор
+    r'мкд\s+\d{1,2}:\d{2}\s+([^А-Ш\n]+)',  # После цена и време
+    r'eur\s+\d{1,2}:\d{2}\s+([^А-Ш\n]+)'  # После EUR цена и време
+)]
 
 
 class KartiEventsScraper:
@@ -49,6 +327,7 @@ class KartiEventsScraper:
         self.debug = debug
         self.raw_data_dir = "../raw_data"
         self.processed_data_dir = "../processed_data"
+        self.cache_dir = "../html_cache"
 
         # Setup logging
         logging.basicConfig(
@@ -59,6 +338,24 @@ class KartiEventsScraper:
 
         os.makedirs(self.raw_data_dir, exist_ok=True)
         os.makedirs(self.processed_data_dir, exist_ok=True)
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        # HTTP сесија за статички fetches (без browser) - retry со
+        # backoff наместо фиксен time.sleep по страница
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': USER_AGENT})
+        retry = Retry(total=3, backoff_factor=0.5,
+                      status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(max_retries=retry, pool_maxsize=16)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        # Кој description селектор погодил колку пати - за рачно
+        # преподредување на DESCRIPTION_SELECTORS по иден опит
+        self._selector_hits = {}
+
+        # Timestamp за тековниот batch (се освежува во scrape_events)
+        self._batch_scraped_at = datetime.now().isoformat()
 
     def clean_old_files(self):
         """Отстрани стари фајлови"""
@@ -70,7 +367,33 @@ class KartiEventsScraper:
             self.logger.info(f"Отстранет фајл: {file_path}")
 
     def setup_driver(self):
-        """Setup Chrome driver со подобрени опции"""
+        """Setup Chrome driver со подобрени опции
+
+        Прво пробува да се закачи на веќе пуштен Chrome на debug портата
+        (нема cold-start по секое пуштање); инаку пушта persistent
+        instance, а како последна опција - класичен fresh Chrome.
+        """
+        # 1. Закачи се на persistent Chrome ако има (или пушти еден)
+        if not self._debugger_port_open():
+            self._launch_persistent_chrome()
+
+        if self._debugger_port_open():
+            try:
+                chrome_options = Options()
+                chrome_options.add_experimental_option(
+                    "debuggerAddress", f"127.0.0.1:{_DEBUG_PORT}")
+                chrome_options.page_load_strategy = 'eager'
+                self.driver = webdriver.Chrome(options=chrome_options)
+                self.driver.set_page_load_timeout(30)
+                self.wait = WebDriverWait(self.driver, 10)
+                self._attached = True
+                self._block_heavy_resources()
+                self.logger.info(f"✅ Закачен на persistent Chrome (порта {_DEBUG_PORT})")
+                return
+            except Exception as e:
+                self.logger.warning(f"⚠️ Не можам да се закачам на persistent Chrome: {e}")
+
+        # 2. Fallback - fresh Chrome по секое пуштање
         chrome_options = Options()
         chrome_options.add_argument("--headless")
         chrome_options.add_argument("--no-sandbox")
@@ -82,52 +405,104 @@ class KartiEventsScraper:
         chrome_options.add_argument("--disable-plugins")
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_argument(
-            "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        )
+        chrome_options.add_argument(f"--user-agent={USER_AGENT}")
+        # Врати контрола на DOMContentLoaded, не чекај ги сите subresources
+        chrome_options.page_load_strategy = 'eager'
+        # Скрепираме само текст - слики/фонтови/стилови се чист I/O отпад
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.stylesheets": 2,
+            "profile.managed_default_content_settings.fonts": 2
+        })
 
         try:
             self.driver = webdriver.Chrome(options=chrome_options)
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             self.driver.set_page_load_timeout(30)
             self.wait = WebDriverWait(self.driver, 10)
+            self._attached = False
+            self._block_heavy_resources()
             self.logger.info("✅ Chrome driver успешно поставен")
         except Exception as e:
             self.logger.error(f"❌ Грешка при поставување на driver: {e}")
             raise
 
+    def _block_heavy_resources(self):
+        """Блокирај слики/фонтови/analytics на CDP ниво"""
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {
+                "urls": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp",
+                         "*.woff*", "*google-analytics*", "*doubleclick*"]
+            })
+        except Exception as e:
+            self.logger.debug(f"CDP блокирање не е достапно: {e}")
+
+    def _debugger_port_open(self) -> bool:
+        """Провери дали Chrome слуша на debug портата"""
+        try:
+            with socket.create_connection(("127.0.0.1", _DEBUG_PORT), timeout=0.5):
+                return True
+        except OSError:
+            return False
+
+    def _launch_persistent_chrome(self):
+        """Пушти detached Chrome со remote debugging порта"""
+        for binary in ("google-chrome", "chromium", "chromium-browser"):
+            chrome_bin = shutil.which(binary)
+            if not chrome_bin:
+                continue
+            try:
+                subprocess.Popen(
+                    [chrome_bin, "--headless", "--no-sandbox",
+                     "--disable-dev-shm-usage", "--disable-gpu",
+                     f"--remote-debugging-port={_DEBUG_PORT}",
+                     "--user-data-dir=/tmp/karti_profile"],
+                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                    start_new_session=True
+                )
+                # Дај му момент да ја отвори портата
+                for _ in range(20):
+                    if self._debugger_port_open():
+                        self.logger.info("🚀 Пуштен persistent Chrome instance")
+                        return
+                    time.sleep(0.25)
+                return
+            except Exception as e:
+                self.logger.debug(f"Не можам да пуштам {binary}: {e}")
+        self.logger.debug("Нема Chrome binary за persistent instance")
+
     def close_driver(self):
-        """Затвори го driver-ot"""
+        """Затвори го driver-ot (persistent Chrome останува жив)"""
         if self.driver:
+            # quit() секогаш - за attach сесија chromedriver не гаси
+            # browser што не го пуштил тој, но го стопира сопствениот
+            # service процес (инаку истекува по еден на setup_driver)
             self.driver.quit()
-            self.logger.info("🔒 Driver затворен")
+            self.driver = None
+            if getattr(self, '_attached', False):
+                self.logger.info("🔒 Откачен од persistent Chrome")
+            else:
+                self.logger.info("🔒 Driver затворен")
 
     def generate_event_id(self, title: str, date: str = "") -> str:
-        """Генерира уникатен event_id"""
-        clean_title = re.sub(r'[^\w\s]', '', title.lower())
-        combined = f"{clean_title}_{date}".strip('_')
-        return hashlib.md5(combined.encode()).hexdigest()
+        """Генерира уникатен event_id (мемоизирано по title+date)"""
+        clean_title = _CLEAN_TITLE_RE.sub('', title.lower())
+        return _event_id(clean_title, date)
 
     def parse_date(self, date_text: str) -> str:
-        """Парсирај датум од различни формати"""
+        """Парсирај датум од различни формати (единечна вредност)
+
+        За многу датуми одеднаш користи parse_dates_batch.
+        """
         if not date_text:
             return ""
 
         # Почисти го текстот
         date_text = date_text.strip()
 
-        # Македонски месеци mapping
-        mk_months = {
-            'Јануари': '01', 'Февруари': '02', 'Март': '03', 'Април': '04',
-            'Мај': '05', 'Јуни': '06', 'Јули': '07', 'Август': '08',
-            'Септември': '09', 'Октомври': '10', 'Ноември': '11', 'Декември': '12',
-            'јануари': '01', 'февруари': '02', 'март': '03', 'април': '04',
-            'мај': '05', 'јуни': '06', 'јули': '07', 'август': '08',
-            'септември': '09', 'октомври': '10', 'ноември': '11', 'декември': '12'
-        }
-
         # Ако е во формат "22 Август 2025"
-        for mk_month, num_month in mk_months.items():
+        for mk_month, num_month in _MK_MONTHS.items():
             if mk_month in date_text:
                 parts = date_text.replace(mk_month, num_month).split()
                 if len(parts) >= 3:
@@ -138,47 +513,75 @@ class KartiEventsScraper:
 
         return date_text
 
-    def parse_price(self, price_text: str) -> Dict:
-        """Парсирај цена информации"""
-        result = {
-            'price_text': price_text,
-            'price_min': None,
-            'price_max': None,
-            'currency': 'MKD',
-            'is_free': False
-        }
+    def parse_dates_batch(self, date_texts: List[str]) -> List[str]:
+        """Парсирај датуми batch преку pd.to_datetime (C parser)
+
+        Еден векторизиран повик за сите cards наместо Python loop по
+        настан; неуспешните вредности паѓаат назад на parse_date.
+        """
+        if not date_texts:
+            return []
+
+        try:
+            series = pd.Series(date_texts, dtype=object).fillna('').str.strip()
+            translated = series.replace(_MK_TO_EN, regex=True)
+            parsed = pd.to_datetime(translated, errors='coerce', dayfirst=True)
+            formatted = parsed.dt.strftime('%Y-%m-%d')
+            # NaT -> fallback на единечниот parser (ranges, слободен текст)
+            return [
+                fmt if isinstance(fmt, str) else self.parse_date(raw)
+                for fmt, raw in zip(formatted, series)
+            ]
+        except Exception as e:
+            self.logger.debug(f"Batch парсирање датуми не успеа: {e}")
+            return [self.parse_date(t) for t in date_texts]
+
+    def _backfill_dates(self, events: List[Dict]):
+        """Пополни date_start од одложените '_raw_date' полиња batch"""
+        pending = [e for e in events if e.get('_raw_date')]
+        if pending:
+            parsed = self.parse_dates_batch([e['_raw_date'] for e in pending])
+            for event, date_start in zip(pending, parsed):
+                event['date_start'] = date_start
+                # Финален id од парсираниот датум - истата репрезентација
+                # како Selenium fallback патот, за да се фаќаат дупликати
+                # меѓу различни патеки на екстракција
+                if event.get('title'):
+                    event['event_id'] = self.generate_event_id(
+                        event['title'], date_start)
+        for event in events:
+            event.pop('_raw_date', None)
 
+    def parse_price(self, price_text: str) -> PriceInfo:
+        """Парсирај цена информации - само полињата што се користат"""
         if not price_text:
-            return result
+            return PriceInfo(None, None, 'MKD', False)
 
         price_text = price_text.strip()
 
         # Провери дали е бесплатно
         if any(word in price_text.lower() for word in ['бесплатно', 'free', 'бесплатен']):
-            result['is_free'] = True
-            return result
+            return PriceInfo(None, None, 'MKD', True)
 
         # Пронајди броеви во текстот
-        numbers = re.findall(r'\d+', price_text)
+        price_min = price_max = None
+        numbers = _DIGITS_RE.findall(price_text)
         if numbers:
-            if len(numbers) == 1:
-                result['price_min'] = int(numbers[0])
-                result['price_max'] = int(numbers[0])
-            elif len(numbers) >= 2:
-                result['price_min'] = int(numbers[0])
-                result['price_max'] = int(numbers[-1])
+            price_min = int(numbers[0])
+            price_max = int(numbers[-1])
 
         # Детектирај валута
+        currency = 'MKD'
         if 'EUR' in price_text.upper() or '€' in price_text:
-            result['currency'] = 'EUR'
+            currency = 'EUR'
         elif 'USD' in price_text.upper() or '$' in price_text:
-            result['currency'] = 'USD'
+            currency = 'USD'
 
-        return result
+        return PriceInfo(price_min, price_max, currency, False)
 
-    def extract_event_from_card(self, event_card) -> Dict:
-        """Извлечи основни податоци од event card"""
-        event_data = {
+    def _empty_event_data(self) -> Dict:
+        """Default шема за еден настан"""
+        return {
             'event_id': '',
             'url': '',
             'title': '',
@@ -197,9 +600,14 @@ class KartiEventsScraper:
             'category': '',
             'organizer': '',
             'image_url': '',
-            'scraped_at': datetime.now().isoformat()
+            # Еден timestamp по batch - не по card
+            'scraped_at': self._batch_scraped_at
         }
 
+    def extract_event_from_card(self, event_card) -> Dict:
+        """Извлечи основни податоци од event card"""
+        event_data = self._empty_event_data()
+
         try:
             # 1. URL - event_card самиот е линк
             href = event_card.get_attribute('href')
@@ -244,8 +652,10 @@ class KartiEventsScraper:
 
                     # Парсирај ја цената
                     price_info = self.parse_price(price_text)
-                    event_data.update(price_info)
-                    event_data['ticket_free'] = price_info['is_free']
+                    event_data['price_min'] = price_info.price_min
+                    event_data['price_max'] = price_info.price_max
+                    event_data['currency'] = price_info.currency
+                    event_data['ticket_free'] = price_info.ticket_free
             except NoSuchElementException:
                 pass
 
@@ -264,20 +674,7 @@ class KartiEventsScraper:
             # 7. Категорија од CSS класите на самиот card
             class_attr = event_card.get_attribute('class')
             if class_attr:
-                if 'concerts' in class_attr:
-                    event_data['category'] = 'Концерт'
-                elif 'festivals' in class_attr:
-                    event_data['category'] = 'Фестивал'
-                elif 'theater' in class_attr:
-                    event_data['category'] = 'Театар'
-                elif 'sport_events' in class_attr:
-                    event_data['category'] = 'Спорт'
-                elif 'philharmonic' in class_attr:
-                    event_data['category'] = 'Филхармонија'
-                elif 'mob' in class_attr:
-                    event_data['category'] = 'Опера/Балет'
-                else:
-                    event_data['category'] = 'Настан'
+                event_data['category'] = self._category_from_classes(class_attr)
 
             # 8. Генерирај event_id
             if event_data['title']:
@@ -295,6 +692,198 @@ class KartiEventsScraper:
             self.logger.error(f"Грешка при извлекување од card: {e}")
             return event_data
 
+    def _event_from_raw(self, raw: Dict) -> Dict:
+        """Состави event dict од суровите card полиња (без Selenium повици)
+
+        Суровите полиња доаѓаат од еден execute_script batch преку
+        _EXTRACT_CARDS_JS; тука е само чист Python parsing.
+        """
+        event_data = self._empty_event_data()
+
+        try:
+            # 1. URL
+            href = raw.get('href', '')
+            if href:
+                if not href.startswith('http'):
+                    href = self.base_url + '/' + href.lstrip('/')
+                event_data['url'] = href
+                event_data['ticket_url'] = href
+
+            # 2. Наслов
+            event_data['title'] = (raw.get('title') or '').strip()
+
+            # 3. Датум - суровиот текст се собира за batch парсирање
+            # (_backfill_dates); range ("22-23 Август 2025") се дели тука
+            date_text = (raw.get('date') or '').strip()
+            if date_text:
+                event_data['_raw_date'] = date_text
+                if '-' in date_text and not date_text.startswith('http'):
+                    parts = date_text.split('-')
+                    if len(parts) >= 2:
+                        event_data['date_end'] = self.parse_date(parts[1].strip())
+
+            # 4. Локација/Venue
+            venue_text = (raw.get('venue') or '').strip()
+            if venue_text:
+                event_data['venue'] = venue_text
+                event_data['location'] = venue_text
+
+            # 5. Цена
+            price_text = (raw.get('cost') or '').strip()
+            if price_text:
+                event_data['ticket_price_text'] = price_text
+                price_info = self.parse_price(price_text)
+                event_data['price_min'] = price_info.price_min
+                event_data['price_max'] = price_info.price_max
+                event_data['currency'] = price_info.currency
+                event_data['ticket_free'] = price_info.ticket_free
+
+            # 6. Слика
+            img_src = raw.get('img', '')
+            if img_src:
+                if not img_src.startswith('http'):
+                    img_src = self.base_url + '/' + img_src.lstrip('/')
+                event_data['image_url'] = img_src
+
+            # 7. Категорија од CSS класите
+            class_attr = raw.get('cls', '')
+            if class_attr:
+                event_data['category'] = self._category_from_classes(class_attr)
+
+            # 8. event_id + основен опис (привремен id од суровиот
+            # датум - _backfill_dates го препресметува од парсираниот)
+            if event_data['title']:
+                event_data['event_id'] = self.generate_event_id(
+                    event_data['title'],
+                    event_data.get('_raw_date', '')
+                )
+                event_data['description'] = f"{event_data['category']}: {event_data['title']}"
+
+        except Exception as e:
+            self.logger.error(f"Грешка при извлекување од card: {e}")
+
+        return event_data
+
+    def _category_from_classes(self, class_attr: str) -> str:
+        """Детектирај категорија од CSS класите на event card
+
+        Работи врз цели class токени - substring проверка погрешно
+        фаќаше нпр. 'mob' во 'mobile-view'.
+        """
+        for token in class_attr.split():
+            category = _CATEGORY_MAP.get(token)
+            if category:
+                return category
+        return 'Настан'
+
+    def fetch_listing_html(self, url: str):
+        """Фечни listing страница преку requests и врати lxml tree
+
+        Една HTTP тура наместо цел Chrome за статички markup.
+        """
+        try:
+            response = self.session.get(url, timeout=15)
+            response.raise_for_status()
+            return lxml.html.fromstring(response.content)
+        except Exception as e:
+            self.logger.warning(f"⚠️ Статички fetch не успеа за {url}: {e}")
+            return None
+
+    def find_static_event_cards(self, tree) -> List:
+        """Најди event cards во парсиран lxml tree (без WebDriver)"""
+        for selector in CARD_SELECTORS:
+            try:
+                cards = tree.cssselect(selector)
+                if cards:
+                    self.logger.info(f"✅ Статички селектор '{selector}' - најдени {len(cards)} cards")
+                    return cards
+            except Exception as e:
+                self.logger.debug(f"Селектор '{selector}' не работи: {e}")
+                continue
+        return []
+
+    def extract_event_from_static_card(self, card) -> Dict:
+        """Извлечи основни податоци од lxml event card
+
+        Иста логика како extract_event_from_card, но чита од локално
+        парсиран HTML - секој `.get()`/`.text_content()` е Python повик
+        наместо JSON-over-HTTP round-trip до chromedriver.
+        """
+        event_data = self._empty_event_data()
+
+        try:
+            # 1. URL - card-от самиот е линк
+            href = card.get('href')
+            if href:
+                if not href.startswith('http'):
+                    href = self.base_url + '/' + href.lstrip('/')
+                event_data['url'] = href
+                event_data['ticket_url'] = href
+
+            # 2. Наслов
+            title_els = card.cssselect(".k-event-list-event-title")
+            if title_els:
+                event_data['title'] = title_els[0].text_content().strip()
+
+            # 3. Датум - суровиот текст оди на batch парсирање
+            date_els = card.cssselect(".k-events-event-date")
+            if date_els:
+                date_text = date_els[0].text_content().strip()
+                event_data['_raw_date'] = date_text
+
+                if '-' in date_text and not date_text.startswith('http'):
+                    parts = date_text.split('-')
+                    if len(parts) >= 2:
+                        event_data['date_end'] = self.parse_date(parts[1].strip())
+
+            # 4. Локација/Venue
+            venue_els = card.cssselect(".k-events-venue-details")
+            if venue_els:
+                venue_text = venue_els[0].text_content().strip()
+                event_data['venue'] = venue_text
+                event_data['location'] = venue_text
+
+            # 5. Цена
+            price_els = card.cssselect(".cost")
+            if price_els:
+                price_text = price_els[0].text_content().strip()
+                event_data['ticket_price_text'] = price_text
+
+                price_info = self.parse_price(price_text)
+                event_data['price_min'] = price_info.price_min
+                event_data['price_max'] = price_info.price_max
+                event_data['currency'] = price_info.currency
+                event_data['ticket_free'] = price_info.ticket_free
+
+            # 6. Слика
+            img_els = card.cssselect(".k-events-event-image img")
+            if img_els:
+                img_src = img_els[0].get('src')
+                if img_src:
+                    if not img_src.startswith('http'):
+                        img_src = self.base_url + '/' + img_src.lstrip('/')
+                    event_data['image_url'] = img_src
+
+            # 7. Категорија од CSS класите
+            class_attr = card.get('class')
+            if class_attr:
+                event_data['category'] = self._category_from_classes(class_attr)
+
+            # 8. Привремен event_id од суровиот датум - _backfill_dates
+            # го препресметува од парсираниот
+            if event_data['title']:
+                event_data['event_id'] = self.generate_event_id(
+                    event_data['title'],
+                    event_data.get('_raw_date', '')
+                )
+                event_data['description'] = f"{event_data['category']}: {event_data['title']}"
+
+            return event_data
+
+        except Exception as e:
+            self.logger.error(f"Грешка при извлекување од статички card: {e}")
+            return event_data
+
     def parse_description_details(self, description: str) -> Dict:
         """Парсирај дополнителни детали од описот"""
         details = {
@@ -310,106 +899,58 @@ class KartiEventsScraper:
         if not description:
             return details
 
-        # 1. Извлечи цени од описот
-        # Пример: "2990-3990 мкд", "70 eur / 4300 мкд", "300 мкд"
-        price_patterns = [
-            r'(\d+[-–]\d+)\s*(мкд|eur|usd|денари)',
-            r'(\d+)\s*(eur|usd)\s*/\s*(\d+)\s*(мкд|денари)',
-            r'(\d+)\s*(мкд|eur|usd|денари)',
-            r'(\d+[-–]\d+)\s*(eur|usd)',
-            r'билети:\s*(\d+[-–]\d+)\s*(мкд|eur)',
-            r'цена:\s*(\d+[-–]\d+)\s*(мкд|eur)',
-            r'карти:\s*(\d+[-–]\d+)\s*(мкд|eur)'
-        ]
-
+        # 1/2/4. Цени, време и контакти - еден finditer помин,
+        # класификација преку lastgroup
         prices_found = []
-        for pattern in price_patterns:
-            matches = re.findall(pattern, description, re.IGNORECASE)
-            for match in matches:
-                if isinstance(match, tuple):
-                    price_text = ' '.join(match).strip()
-                else:
-                    price_text = match.strip()
+        contacts = []
+        for match in _COMBINED_RE.finditer(description):
+            kind = match.lastgroup
+            if kind in _PRICE_GROUPS:
+                price_text = _WS_RE.sub(' ', match.group(kind)).strip()
                 if price_text not in prices_found:
                     prices_found.append(price_text)
+            elif kind in _CONTACT_GROUPS:
+                contacts.append(match.group(kind))
+            elif kind == 'time' and not details['parsed_time']:
+                details['parsed_time'] = match.group('time')
 
         if prices_found:
             details['parsed_price'] = ' | '.join(prices_found)
             details['additional_prices'] = prices_found
 
-        # 2. Извлечи време
-        # Пример: "20:00", "22:00", "09:00"
-        time_patterns = [
-            r'(\d{1,2}:\d{2})',
-            r'во\s*(\d{1,2}:\d{2})',
-            r'почеток\s*(\d{1,2}:\d{2})',
-            r'старт\s*(\d{1,2}:\d{2})'
-        ]
-
-        for pattern in time_patterns:
-            match = re.search(pattern, description, re.IGNORECASE)
-            if match:
-                details['parsed_time'] = match.group(1)
-                break
+        if contacts:
+            details['contact_info'] = ' | '.join(contacts)
 
         # 3. Извлечи venue/локација од описот
-        # Обично е по време, пред опис
-        venue_patterns = [
-            r'(\d{1,2}:\d{2})\s+([^А-Ш]+?)(?=[А-Ш]|$)',  # После време до прв македонски збор
-            r'мкд\s+\d{1,2}:\d{2}\s+([^А-Ш\n]+)',  # После цена и време
-            r'eur\s+\d{1,2}:\d{2}\s+([^А-Ш\n]+)'  # После EUR цена и време
-        ]
-
-        for pattern in venue_patterns:
-            match = re.search(pattern, description, re.IGNORECASE)
+        for pattern in _VENUE_PATTERNS:
+            match = pattern.search(description)
             if match:
                 venue = match.group(-1).strip()
                 if len(venue) > 5 and len(venue) < 100:  # Разумна должина
                     details['parsed_venue'] = venue
                     break
 
-        # 4. Контакт информации
-        contact_patterns = [
-            r'тел\.?\s*:?\s*(\d{2,3}[-\s]*\d{3}[-\s]*\d{3,4})',
-            r'телефон\s*:?\s*(\d{2,3}[-\s]*\d{3}[-\s]*\d{3,4})',
-            r'контакт\s*:?\s*(\d{2,3}[-\s]*\d{3}[-\s]*\d{3,4})',
-            r'([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})',  # email
-            r'(www\.[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})',  # website
-            r'(facebook\.com/[a-zA-Z0-9._-]+)',
-            r'(instagram\.com/[a-zA-Z0-9._-]+)'
-        ]
-
-        contacts = []
-        for pattern in contact_patterns:
-            matches = re.findall(pattern, description, re.IGNORECASE)
-            contacts.extend(matches)
-
-        if contacts:
-            details['contact_info'] = ' | '.join(contacts)
-
-        # 5. Тип на настан од клучни зборови
-        event_types = {
-            'концерт': ['концерт', 'настап', 'музика', 'пејач', 'бенд'],
-            'фестивал': ['фестивал', 'festival'],
-            'театар': ['театар', 'претстава', 'drama', 'comedy'],
-            'спорт': ['натпревар', 'фудбал', 'кошарка', 'спорт'],
-            'конференција': ['форум', 'конференција', 'семинар', 'work'],
-            'забава': ['парти', 'журка', 'party', 'dance']
-        }
-
-        for event_type, keywords in event_types.items():
-            for keyword in keywords:
-                if keyword.lower() in description.lower():
+        # 5. Тип на настан од клучни зборови - lowercase еднаш, потоа
+        # еден O(n) Aho-Corasick помин наместо ~20 substring скенови
+        desc_low = description.lower()
+        if _EVENT_TYPE_AUTOMATON is not None:
+            # Сите погодоци, па избор по декларациски приоритет - не по
+            # позиција во текстот, за да се совпаѓа со fallback патот
+            hits = {event_type
+                    for _, event_type in _EVENT_TYPE_AUTOMATON.iter(desc_low)}
+            if hits:
+                details['event_type'] = min(hits, key=_EVENT_TYPE_PRIORITY.get)
+        else:
+            for event_type, keywords in EVENT_TYPES.items():
+                if any(keyword in desc_low for keyword in keywords):
                     details['event_type'] = event_type
                     break
-            if details['event_type']:
-                break
 
         return details
 
-    def scrape_event_details(self, event_url: str) -> Dict:
-        """Влегува во линкот на настанот и скрепира детални податоци"""
-        details = {
+    def _empty_details(self) -> Dict:
+        """Default шема за детални податоци од еден настан"""
+        return {
             'description_full': '',
             'organizer': '',
             'contact_info': '',
@@ -421,47 +962,227 @@ class KartiEventsScraper:
             'parsed_details': {}
         }
 
-        if not event_url:
+    def _fetch_detail_html(self, url: str) -> str:
+        """Фечни детална страница преку HTTP сесијата (без browser)
+
+        Одговорите се кешираат на диск по md5(url) - при повторно
+        пуштање/дебагирање нема повторен download.
+        """
+        cache_path = os.path.join(
+            self.cache_dir, hashlib.md5(url.encode()).hexdigest() + '.html.gz')
+        if os.path.exists(cache_path):
+            try:
+                with gzip.open(cache_path, 'rt', encoding='utf-8') as f:
+                    return f.read()
+            except Exception as e:
+                self.logger.debug(f"Кеш читање не успеа за {url}: {e}")
+
+        try:
+            response = self.session.get(url, timeout=15)
+            if response.status_code >= 400:
+                return ""
+            html = response.text
+        except Exception as e:
+            self.logger.debug(f"Fetch не успеа за {url}: {e}")
+            return ""
+
+        try:
+            # compresslevel=1 - брзината на компресија е поважна од ratio
+            with gzip.open(cache_path, 'wt', encoding='utf-8', compresslevel=1) as f:
+                f.write(html)
+        except Exception as e:
+            self.logger.debug(f"Кеш запис не успеа за {url}: {e}")
+
+        return html
+
+    def _parse_detail_html(self, html: str) -> Dict:
+        """Парсирај детали од HTML стринг - чиста CPU работа, без driver
+
+        Истите селектори како scrape_event_details, но врз локално
+        парсиран lxml tree, па може да се вика од worker threads.
+        """
+        details = self._empty_details()
+        if not html:
             return details
 
+        if HAS_SELECTOLAX:
+            return self._parse_detail_selectolax(html)
+
         try:
-            self.logger.info(f"  📄 Влегувам во: {event_url}")
-            self.driver.get(event_url)
-            time.sleep(3)
+            tree = lxml.html.fromstring(html)
 
-            # 1. Основен опис/содржина - земи ГИ СИТЕ можни извори
-            description_selectors = [
-                "body",  # Цела страница ако е потребно
-                "main",
-                ".container",
-                ".content",
-                ".event-description",
-                ".event-content",
-                ".description",
-                ".event-details",
-                "[class*='description']",
-                "[class*='content']",
-                ".entry-content",
-                "article",
-                ".text"
-            ]
+            # 1. Опис - прв доволно долг погодок победува (селекторите се
+            # подредени специфично->општо), инаку најдолгиот
+            best_description = ""
+            best_selector = ""
+            for selector in DESCRIPTION_SELECTORS:
+                try:
+                    nodes = tree.cssselect(selector)
+                except Exception:
+                    continue
+                if nodes:
+                    desc_text = _WS_RE.sub(' ', nodes[0].text_content()).strip()
+                    if len(desc_text) > _DESCRIPTION_MIN_LEN:
+                        best_description = desc_text
+                        best_selector = selector
+                        break
+                    if len(desc_text) > len(best_description):
+                        best_description = desc_text
+                        best_selector = selector
+
+            if best_selector:
+                self._selector_hits[best_selector] = \
+                    self._selector_hits.get(best_selector, 0) + 1
+
+            if best_description and len(best_description) > 20:
+                details['description_full'] = best_description
+                details['parsed_details'] = self.parse_description_details(best_description)
+
+            # 2. Организатор
+            for selector in ORGANIZER_SELECTORS:
+                try:
+                    nodes = tree.cssselect(selector)
+                except Exception:
+                    continue
+                if nodes:
+                    org_text = nodes[0].text_content().strip()
+                    if org_text and len(org_text) < 100:
+                        details['organizer'] = org_text
+                        break
+
+            # 3. Дополнителни информации - целиот текст, ограничен
+            clean_text = _WS_RE.sub(' ', tree.text_content()).strip()
+            if len(clean_text) > len(details['description_full']):
+                details['additional_info'] = clean_text[:5000]
 
+            # 4. Билет информации
+            ticket_info = []
+            for selector in TICKET_SELECTORS:
+                try:
+                    nodes = tree.cssselect(selector)
+                except Exception:
+                    continue
+                for node in nodes:
+                    text = node.text_content().strip()
+                    if text and len(text) < 500 and text not in ticket_info:
+                        ticket_info.append(text)
+
+            if ticket_info:
+                details['ticket_info'] = ' | '.join(ticket_info)
+
+        except Exception as e:
+            self.logger.error(f"    ❌ Грешка при парсирање детали: {e}")
+
+        return details
+
+    def _parse_detail_selectolax(self, html: str) -> Dict:
+        """Истата екстракција како lxml патот, врз selectolax
+
+        Modest е C parser - еден parse на целиот HTML е поевтин од
+        lxml, а многу поевтин од WebDriver round-trip по селектор.
+        """
+        details = self._empty_details()
+
+        try:
+            tree = HTMLParser(html)
+
+            # 1. Опис - прв доволно долг погодок победува
             best_description = ""
-            for selector in description_selectors:
+            best_selector = ""
+            for selector in DESCRIPTION_SELECTORS:
                 try:
-                    desc_element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    if desc_element:
-                        desc_text = desc_element.text.strip()
-                        # Отстрани вишок whitespace
-                        desc_text = re.sub(r'\s+', ' ', desc_text)
+                    node = tree.css_first(selector)
+                except Exception:
+                    continue
+                if node is not None:
+                    desc_text = _WS_RE.sub(' ', node.text(separator=' ')).strip()
+                    if len(desc_text) > _DESCRIPTION_MIN_LEN:
+                        best_description = desc_text
+                        best_selector = selector
+                        break
+                    if len(desc_text) > len(best_description):
+                        best_description = desc_text
+                        best_selector = selector
 
-                        # Земи го најдолгиот опис
-                        if len(desc_text) > len(best_description):
-                            best_description = desc_text
+            if best_selector:
+                self._selector_hits[best_selector] = \
+                    self._selector_hits.get(best_selector, 0) + 1
 
-                except NoSuchElementException:
+            if best_description and len(best_description) > 20:
+                details['description_full'] = best_description
+                details['parsed_details'] = self.parse_description_details(best_description)
+
+            # 2. Организатор
+            for selector in ORGANIZER_SELECTORS:
+                try:
+                    node = tree.css_first(selector)
+                except Exception:
                     continue
+                if node is not None:
+                    org_text = node.text(separator=' ').strip()
+                    if org_text and len(org_text) < 100:
+                        details['organizer'] = org_text
+                        break
+
+            # 3. Дополнителни информации - целиот текст, ограничен
+            root = tree.body if tree.body is not None else tree.root
+            if root is not None:
+                clean_text = _WS_RE.sub(' ', root.text(separator=' ')).strip()
+                if len(clean_text) > len(details['description_full']):
+                    details['additional_info'] = clean_text[:5000]
+
+            # 4. Билет информации - споениот селектор во еден css() повик
+            ticket_info = []
+            for node in tree.css(_TICKET_SELECTOR_COMBINED):
+                text = node.text(separator=' ').strip()
+                if text and len(text) < 500 and text not in ticket_info:
+                    ticket_info.append(text)
+
+            if ticket_info:
+                details['ticket_info'] = ' | '.join(ticket_info)
 
+        except Exception as e:
+            self.logger.error(f"    ❌ Грешка при парсирање детали: {e}")
+
+        return details
+
+    def scrape_event_details(self, event_url: str) -> Dict:
+        """Влегува во линкот на настанот и скрепира детални податоци"""
+        details = self._empty_details()
+
+        if not event_url:
+            return details
+
+        try:
+            self.logger.info(f"  📄 Влегувам во: {event_url}")
+            self.driver.get(event_url)
+            time.sleep(3)
+
+            # Еден page_source трансфер + локален C parse наместо
+            # повеќе WebDriver round-trips по селектор
+            if HAS_SELECTOLAX:
+                details = self._parse_detail_selectolax(self.driver.page_source)
+                if details['description_full']:
+                    self.logger.info(
+                        f"    📝 Опис: {details['description_full'][:100]}...")
+                if details['organizer']:
+                    self.logger.info(f"    🏢 Организатор: {details['organizer']}")
+                if details['ticket_info']:
+                    self.logger.info(f"    🎫 Билет инфо: {details['ticket_info'][:100]}...")
+                return details
+
+            # 1+2. Опис и организатор - сите селектор проби во еден
+            # execute_script (еден WebDriver round-trip наместо 23)
+            probe = self.driver.execute_script(_DETAIL_PROBE_JS, {
+                'desc': DESCRIPTION_SELECTORS,
+                'org': ORGANIZER_SELECTORS
+            }, _DESCRIPTION_MIN_LEN) or {}
+
+            if probe.get('descSel'):
+                self._selector_hits[probe['descSel']] = \
+                    self._selector_hits.get(probe['descSel'], 0) + 1
+
+            best_description = _WS_RE.sub(' ', probe.get('desc') or '').strip()
             if best_description and len(best_description) > 20:
                 details['description_full'] = best_description
                 self.logger.info(f"    📝 Опис: {best_description[:100]}...")
@@ -479,79 +1200,39 @@ class KartiEventsScraper:
                 if parsed['contact_info']:
                     self.logger.info(f"    📞 Контакт: {parsed['contact_info']}")
 
-            # 2. Пробај да најдеш специфични организатори/продавачи
-            organizer_selectors = [
-                ".organizer",
-                ".event-organizer",
-                ".promoter",
-                ".seller",
-                ".vendor",
-                "[class*='organizer']",
-                "[class*='promoter']",
-                ".event-info .organizer",
-                ".meta .organizer",
-                ".author"
-            ]
+            org_text = (probe.get('org') or '').strip()
+            if org_text:
+                details['organizer'] = org_text
+                self.logger.info(f"    🏢 Организатор: {details['organizer']}")
 
-            for selector in organizer_selectors:
+            # 3. Дополнителни детали - ограничено извлекување директно во
+            # browser-от. page_source + DOM parse алоцираше MB-и текст за
+            # 5000 карактери; innerText.slice се пресметува во Blink/V8
+            # пред да ја премине CDP границата
+            if len(details.get('description_full', '')) < 1000:
                 try:
-                    org_element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    if org_element and org_element.text.strip():
-                        org_text = org_element.text.strip()
-                        if len(org_text) < 100:  # Не преголем текст
-                            details['organizer'] = org_text
-                            self.logger.info(f"    🏢 Организатор: {details['organizer']}")
-                            break
-                except NoSuchElementException:
-                    continue
+                    clean_text = self.driver.execute_script(
+                        "return (document.querySelector('main') || document.body)"
+                        ".innerText.slice(0, 5000);")
+                    if clean_text:
+                        clean_text = _WS_RE.sub(' ', clean_text).strip()
+                        if len(clean_text) > len(details.get('description_full', '')):
+                            details['additional_info'] = clean_text
+                except Exception as e:
+                    self.logger.debug(f"Не можам да земам дополнителни информации: {e}")
 
-            # 3. Дополнителни детали - земи сè што е достапно
+            # 4. Специфични билет информации - еден find_elements со
+            # запирка-споени селектори наместо 7 round-trips
+            ticket_info = []
             try:
-                # Пробај да земеш сè од страницата
-                page_source = self.driver.page_source
-                if page_source and len(page_source) > 1000:
-                    # Отстрани HTML тагови и извлечи чист текст
-                    if HAS_BS4:
-                        try:
-                            soup = BeautifulSoup(page_source, 'html.parser')
-                            clean_text = soup.get_text()
-                            # Почисти го текстот
-                            clean_text = re.sub(r'\s+', ' ', clean_text).strip()
-
-                            if len(clean_text) > len(details.get('description_full', '')):
-                                details['additional_info'] = clean_text[:5000]  # Првите 5000 карактери
-                        except Exception as e:
-                            self.logger.debug(f"BeautifulSoup грешка: {e}")
-                    else:
-                        # Ако нема BeautifulSoup, користи regex
-                        clean_text = re.sub(r'<[^>]+>', '', page_source)
-                        clean_text = re.sub(r'\s+', ' ', clean_text).strip()
-                        details['additional_info'] = clean_text[:3000]
-
+                elements = self.driver.find_elements(
+                    By.CSS_SELECTOR, _TICKET_SELECTOR_COMBINED)
+                for element in elements:
+                    text = element.text.strip()
+                    if text and len(text) < 500 and text not in ticket_info:
+                        ticket_info.append(text)
             except Exception as e:
-                self.logger.debug(f"Не можам да земам дополнителни информации: {e}")
-
-            # 4. Специфични билет информации
-            ticket_selectors = [
-                ".ticket-info",
-                ".ticket-details",
-                ".price-info",
-                "[class*='ticket']",
-                "[class*='price']",
-                ".buy-ticket",
-                ".purchase"
-            ]
-
-            ticket_info = []
-            for selector in ticket_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for element in elements:
-                        text = element.text.strip()
-                        if text and len(text) < 500 and text not in ticket_info:
-                            ticket_info.append(text)
-                except NoSuchElementException:
-                    continue
+                self.logger.debug(f"Билет селектори не работат: {e}")
 
             if ticket_info:
                 details['ticket_info'] = ' | '.join(ticket_info)
@@ -564,16 +1245,18 @@ class KartiEventsScraper:
 
     def find_event_cards(self) -> List:
         """Најди ги сите event cards на страницата"""
-        card_selectors = [
-            "a.k_event_link",  # Од дадениот HTML
-            ".k_event_link",
-            "[class*='event-card']",
-            "[class*='event-item']",
-            ".event-container a",
-            ".events-list a"
-        ]
+        # Сите селектори во еден execute_script повик
+        try:
+            result = self.driver.execute_script(_FIND_CARDS_JS, CARD_SELECTORS)
+            if result and result.get('cards'):
+                self.logger.info(
+                    f"✅ Користам селектор '{result['selector']}' - најдени {len(result['cards'])} cards")
+                return result['cards']
+        except Exception as e:
+            self.logger.debug(f"JS проба за cards не работи: {e}")
 
-        for selector in card_selectors:
+        # Fallback - еден find_elements по селектор
+        for selector in CARD_SELECTORS:
             try:
                 cards = self.driver.find_elements(By.CSS_SELECTOR, selector)
                 if cards:
@@ -623,60 +1306,101 @@ class KartiEventsScraper:
         """Главна функција за скрепирање настани"""
         self.logger.info("🚀 Започнувам скрепирање настани од karti.com.mk...")
 
-        try:
-            self.driver.get(self.events_url)
-            self.logger.info(f"📖 Вчитана страница: {self.events_url}")
-            time.sleep(5)
+        # Сите настани од овој batch делат еден scraped_at timestamp
+        self._batch_scraped_at = datetime.now().isoformat()
 
+        try:
             all_events = []
 
-            # Пробај да вчиташ повеќе настани
-            for attempt in range(max_load_attempts):
-                self.logger.info(f"\n🔍 === Обид {attempt + 1}/{max_load_attempts} ===")
+            # Прво пробај статички fetch - card markup-от е статичен, па
+            # Selenium треба само кога содржината е зад AJAX "load more"
+            if HAS_LXML:
+                tree = self.fetch_listing_html(self.events_url)
+                if tree is not None:
+                    static_cards = self.find_static_event_cards(tree)
+                    needs_js = tree.cssselect("#show_more_events")
+                    if static_cards and not needs_js:
+                        self.logger.info("⚡ Листата е статичка - извлекувам без Selenium")
+                        for card in static_cards:
+                            try:
+                                event_data = self.extract_event_from_static_card(card)
+                                if event_data['title'] and event_data['event_id']:
+                                    all_events.append(event_data)
+                            except Exception as e:
+                                self.logger.error(f"⚠️ Грешка при обработка на card: {e}")
+                                continue
+                        self.logger.info(f"✅ Собрани {len(all_events)} валидни настани")
+
+            if not all_events:
+                self.driver.get(self.events_url)
+                self.logger.info(f"📖 Вчитана страница: {self.events_url}")
+                try:
+                    WebDriverWait(self.driver, 5).until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, 'body')))
+                except TimeoutException:
+                    pass
 
-                # Најди ги event cards
-                event_cards = self.find_event_cards()
+                # Пробај да вчиташ повеќе настани
+                for attempt in range(max_load_attempts):
+                    self.logger.info(f"\n🔍 === Обид {attempt + 1}/{max_load_attempts} ===")
 
-                if not event_cards:
-                    self.logger.warning("❌ Нема event cards")
-                    break
+                    # Најди ги event cards
+                    event_cards = self.find_event_cards()
 
-                self.logger.info(f"📊 Најдени {len(event_cards)} event cards")
+                    if not event_cards:
+                        self.logger.warning("❌ Нема event cards")
+                        break
 
-                # Извлечи податоци од секој card
-                current_events = []
-                for i, card in enumerate(event_cards):
-                    try:
-                        if self.debug and i < 3:  # Debug првите 3
-                            self.logger.info(f"\n--- Card {i + 1} ---")
-
-                        event_data = self.extract_event_from_card(card)
-
-                        if event_data['title'] and event_data['event_id']:
-                            current_events.append(event_data)
-                            if self.debug and i < 3:
-                                self.logger.info(f"✅ {event_data['title']}")
-                                self.logger.info(f"   📅 {event_data['date_start']}")
-                                self.logger.info(f"   🏢 {event_data['venue']}")
-                                self.logger.info(f"   💰 {event_data['ticket_price_text']}")
-                        else:
-                            if self.debug and i < 3:
-                                self.logger.warning(f"❌ Card {i + 1}: Нема валидни податоци")
+                    self.logger.info(f"📊 Најдени {len(event_cards)} event cards")
 
+                    # Сите полиња од сите cards во еден JS повик, потоа
+                    # чист Python parsing по card
+                    try:
+                        raw_cards = self.driver.execute_script(_EXTRACT_CARDS_JS, event_cards)
                     except Exception as e:
-                        self.logger.error(f"⚠️ Грешка при обработка на card {i + 1}: {e}")
-                        continue
+                        self.logger.debug(f"Batch извлекување не работи: {e}")
+                        raw_cards = None
 
-                self.logger.info(f"✅ Обид {attempt + 1}: Собрани {len(current_events)} валидни настани")
-                all_events.extend(current_events)
+                    current_events = []
+                    for i, item in enumerate(raw_cards if raw_cards is not None else event_cards):
+                        try:
+                            if self.debug and i < 3:  # Debug првите 3
+                                self.logger.info(f"\n--- Card {i + 1} ---")
+
+                            if raw_cards is not None:
+                                event_data = self._event_from_raw(item)
+                            else:
+                                event_data = self.extract_event_from_card(item)
+
+                            if event_data['title'] and event_data['event_id']:
+                                current_events.append(event_data)
+                                if self.debug and i < 3:
+                                    self.logger.info(f"✅ {event_data['title']}")
+                                    # date_start се пополнува дури во
+                                    # _backfill_dates - логирај го суровиот
+                                    self.logger.info(
+                                        f"   📅 {event_data.get('_raw_date') or event_data['date_start']}")
+                                    self.logger.info(f"   🏢 {event_data['venue']}")
+                                    self.logger.info(f"   💰 {event_data['ticket_price_text']}")
+                            else:
+                                if self.debug and i < 3:
+                                    self.logger.warning(f"❌ Card {i + 1}: Нема валидни податоци")
 
-                # Пробај да вчиташ повеќе
-                if attempt < max_load_attempts - 1:
-                    if not self.scroll_and_load_more():
-                        self.logger.info("🔚 Нема повеќе настани за вчитување")
-                        break
+                        except Exception as e:
+                            self.logger.error(f"⚠️ Грешка при обработка на card {i + 1}: {e}")
+                            continue
+
+                    self.logger.info(f"✅ Обид {attempt + 1}: Собрани {len(current_events)} валидни настани")
+                    all_events.extend(current_events)
 
-            # Отстрани дупликати
+                    # Пробај да вчиташ повеќе
+                    if attempt < max_load_attempts - 1:
+                        if not self.scroll_and_load_more():
+                            self.logger.info("🔚 Нема повеќе настани за вчитување")
+                            break
+
+            # Batch парсирање на одложените датуми, па дупликати
+            self._backfill_dates(all_events)
             unique_events = self.remove_duplicates(all_events)
             self.logger.info(f"🧹 После отстранување дупликати: {len(unique_events)} уникатни настани")
 
@@ -690,20 +1414,205 @@ class KartiEventsScraper:
             return []
 
     def remove_duplicates(self, events: List[Dict]) -> List[Dict]:
-        """Отстрани дупликати врз база на event_id"""
+        """Отстрани дупликати врз база на event_id (O(N) set)
+
+        Без DataFrame round-trip - to_dict('records') враќа NaN за
+        клучеви што ги нема кај сите настани и ги коерцира типовите.
+        """
+        if not events:
+            return []
+
+        seen = set()
         unique_events = []
-        seen_ids = set()
+        for event in events:
+            event_id = event.get('event_id')
+            if not event_id or event_id in seen:
+                continue
+            seen.add(event_id)
+            unique_events.append(event)
+
+        removed = len(events) - len(unique_events)
+        if removed and self.debug:
+            self.logger.debug(f"🗑️ Отстранети {removed} дупликати")
+
+        return unique_events
+
+    def _dedupe_by_url(self, events: List[Dict]) -> List[Dict]:
+        """O(N) дедупликација по URL пред downstream пасовите
 
+        event_id дедупликацијата фаќа исти наслов+датум; URL-от фаќа
+        ист настан внесен од две фази, пред CSV/summary да платат N.
+        """
+        seen = set()
+        unique_events = []
         for event in events:
-            event_id = event.get('event_id', '')
-            if event_id and event_id not in seen_ids:
-                unique_events.append(event)
-                seen_ids.add(event_id)
-            elif self.debug:
-                self.logger.debug(f"🗑️ Дупликат отстранет: {event.get('title', 'No title')}")
+            url = event.get('url')
+            if url and url in seen:
+                continue
+            if url:
+                seen.add(url)
+            unique_events.append(event)
+
+        removed = len(events) - len(unique_events)
+        if removed and self.debug:
+            self.logger.debug(f"🗑️ Отстранети {removed} URL дупликати")
 
         return unique_events
 
+    def _merge_details(self, event: Dict, details: Dict):
+        """Мерџирај детали во event dict-от"""
+        if details['description_full']:
+            event['description'] = details['description_full']
+        if details['organizer']:
+            event['organizer'] = details['organizer']
+        if details['contact_info']:
+            event['contact_info'] = details['contact_info']
+        if details['ticket_info']:
+            event['ticket_info'] = details['ticket_info']
+        if details['additional_info']:
+            event['additional_info'] = details['additional_info']
+
+        # Додај парсирани детали како посебни полиња
+        parsed = details.get('parsed_details', {})
+        if parsed:
+            if parsed.get('parsed_price'):
+                event['parsed_price'] = parsed['parsed_price']
+            if parsed.get('parsed_time'):
+                event['parsed_time'] = parsed['parsed_time']
+            if parsed.get('parsed_venue'):
+                event['parsed_venue'] = parsed['parsed_venue']
+            if parsed.get('contact_info'):
+                event['parsed_contact'] = parsed['contact_info']
+            if parsed.get('event_type'):
+                event['parsed_event_type'] = parsed['event_type']
+            if parsed.get('additional_prices'):
+                event['all_prices'] = ', '.join(parsed['additional_prices'])
+
+        # Додај сите останати детали
+        event.update({k: v for k, v in details.items() if v and k != 'parsed_details'})
+
+    async def _fetch_many_async(self, urls: List[str]) -> Dict[str, str]:
+        """Фечни повеќе детал-страници конкурентно преку httpx
+
+        asyncio.gather ги преклопува мрежните латенции на сите URL-а во
+        еден event loop; дисковиот gzip кеш е споделен со синхрониот пат.
+        """
+        results = {}
+        to_fetch = []
+        for url in urls:
+            cache_path = os.path.join(
+                self.cache_dir, hashlib.md5(url.encode()).hexdigest() + '.html.gz')
+            if os.path.exists(cache_path):
+                try:
+                    with gzip.open(cache_path, 'rt', encoding='utf-8') as f:
+                        results[url] = f.read()
+                    continue
+                except Exception as e:
+                    self.logger.debug(f"Кеш читање не успеа за {url}: {e}")
+            to_fetch.append(url)
+
+        if not to_fetch:
+            return results
+
+        client_kwargs = dict(
+            headers={'User-Agent': USER_AGENT},
+            limits=httpx.Limits(max_connections=32),
+            timeout=15, follow_redirects=True)
+        try:
+            # HTTP/2 мултиплексира повеќе барања на една конекција
+            client = httpx.AsyncClient(http2=True, **client_kwargs)
+        except ImportError:
+            client = httpx.AsyncClient(**client_kwargs)
+
+        async def fetch_one(url):
+            try:
+                response = await client.get(url)
+                if response.status_code >= 400:
+                    return url, ""
+                return url, response.text
+            except Exception as e:
+                self.logger.debug(f"Async fetch не успеа за {url}: {e}")
+                return url, ""
+
+        async with client:
+            for url, html in await asyncio.gather(*(fetch_one(u) for u in to_fetch)):
+                results[url] = html
+                if not html:
+                    continue
+                cache_path = os.path.join(
+                    self.cache_dir, hashlib.md5(url.encode()).hexdigest() + '.html.gz')
+                try:
+                    with gzip.open(cache_path, 'wt', encoding='utf-8',
+                                   compresslevel=1) as f:
+                        f.write(html)
+                except Exception as e:
+                    self.logger.debug(f"Кеш запис не успеа за {url}: {e}")
+
+        return results
+
+    def _scrape_detailed_data_async(self, events: List[Dict]) -> List[Dict]:
+        """Паралелна ФАЗА 2 преку httpx.AsyncClient
+
+        Сите download-и се преклопуваат во еден event loop; страници чиј
+        статички HTML нема детал-маркери одат на Selenium fallback -
+        browser-от се користи само каде што мора.
+        """
+        with_url = [event for event in events if event.get('url')]
+        html_by_url = asyncio.run(
+            self._fetch_many_async([event['url'] for event in with_url]))
+
+        needs_selenium = []
+        for i, event in enumerate(with_url):
+            html = html_by_url.get(event['url'], "")
+            details = self._parse_detail_html(html) if html else None
+            if details and (details['description_full'] or details['ticket_info']):
+                self._merge_details(event, details)
+                self.logger.info(f"🎭 {i + 1}/{len(with_url)} - {event['title']}")
+            else:
+                needs_selenium.append(event)
+
+        # JS-рендерирани детални страници - само тие преку browser
+        if needs_selenium and self.driver:
+            self.logger.info(f"🌐 Selenium fallback за {len(needs_selenium)} страници")
+            for event in needs_selenium:
+                try:
+                    details = self.scrape_event_details(event['url'])
+                    self._merge_details(event, details)
+                except Exception as e:
+                    self.logger.error(f"    ❌ Грешка при детално скрепирање: {e}")
+
+        return events
+
+    def _scrape_detailed_data_http(self, events: List[Dict]) -> List[Dict]:
+        """Паралелна ФАЗА 2: HTTP fetchers во thread pool
+
+        Детал-страниците се мрежно-bound; 16 паралелни fetches наместо
+        driver.get + time.sleep(3) по URL. Парсирањето е чиста CPU
+        работа врз локален lxml tree.
+        """
+        futures = {}
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            for event in events:
+                if event.get('url'):
+                    futures[executor.submit(self._fetch_detail_html, event['url'])] = event
+
+            done = 0
+            for future in as_completed(futures):
+                event = futures[future]
+                done += 1
+                try:
+                    html = future.result()
+                    if html:
+                        details = self._parse_detail_html(html)
+                        self._merge_details(event, details)
+                        self.logger.info(f"🎭 {done}/{len(futures)} - {event['title']}")
+                    else:
+                        self.logger.warning(f"⚠️ {done}/{len(futures)} - нема HTML за {event['title']}")
+                except Exception as e:
+                    self.logger.error(f"    ❌ Грешка при детално скрепирање: {e}")
+
+        return events
+
     def scrape_detailed_data(self, events: List[Dict]) -> List[Dict]:
         """Фаза 2: Собирај детални податоци од секој настан"""
         if not events:
@@ -711,6 +1620,20 @@ class KartiEventsScraper:
 
         self.logger.info(f"\n🎬 === ФАЗА 2: Детални податоци за {len(events)} настани ===")
 
+        # Async HTTP батч кога httpx е достапен; Selenium се користи
+        # само за страници без статички детали
+        if HAS_HTTPX and HAS_LXML:
+            detailed_events = self._scrape_detailed_data_async(events)
+            self.logger.info(f"\n✅ ФАЗА 2 завршена: {len(detailed_events)} настани со детали")
+            return detailed_events
+
+        # Паралелна HTTP патека кога lxml е достапен; Selenium fallback
+        # за JS-рендерирани детални страници
+        if HAS_LXML:
+            detailed_events = self._scrape_detailed_data_http(events)
+            self.logger.info(f"\n✅ ФАЗА 2 завршена: {len(detailed_events)} настани со детали")
+            return detailed_events
+
         detailed_events = []
         for i, event in enumerate(events):
             self.logger.info(f"\n🎭 {i + 1}/{len(events)} - {event['title']}")
@@ -718,38 +1641,7 @@ class KartiEventsScraper:
             if event.get('url'):
                 try:
                     details = self.scrape_event_details(event['url'])
-
-                    # Мерџирај ги деталите
-                    if details['description_full']:
-                        event['description'] = details['description_full']
-                    if details['organizer']:
-                        event['organizer'] = details['organizer']
-                    if details['contact_info']:
-                        event['contact_info'] = details['contact_info']
-                    if details['ticket_info']:
-                        event['ticket_info'] = details['ticket_info']
-                    if details['additional_info']:
-                        event['additional_info'] = details['additional_info']
-
-                    # Додај парсирани детали како посебни полиња
-                    parsed = details.get('parsed_details', {})
-                    if parsed:
-                        if parsed.get('parsed_price'):
-                            event['parsed_price'] = parsed['parsed_price']
-                        if parsed.get('parsed_time'):
-                            event['parsed_time'] = parsed['parsed_time']
-                        if parsed.get('parsed_venue'):
-                            event['parsed_venue'] = parsed['parsed_venue']
-                        if parsed.get('contact_info'):
-                            event['parsed_contact'] = parsed['contact_info']
-                        if parsed.get('event_type'):
-                            event['parsed_event_type'] = parsed['event_type']
-                        if parsed.get('additional_prices'):
-                            event['all_prices'] = ', '.join(parsed['additional_prices'])
-
-                    # Додај сите останати детали
-                    event.update({k: v for k, v in details.items() if v and k != 'parsed_details'})
-
+                    self._merge_details(event, details)
                 except Exception as e:
                     self.logger.error(f"    ❌ Грешка при детално скрепирање: {e}")
             else:
@@ -760,8 +1652,13 @@ class KartiEventsScraper:
         self.logger.info(f"\n✅ ФАЗА 2 завршена: {len(detailed_events)} настани со детали")
         return detailed_events
 
-    def save_to_csv(self, events: List[Dict], filename_suffix: str = "") -> str:
-        """Зачувај ги настаните во CSV"""
+    def save_to_csv(self, events: List[Dict], filename_suffix: str = "",
+                    use_pandas: bool = False) -> str:
+        """Зачувај ги настаните во CSV
+
+        Default патеката стрима редови преку stdlib csv.DictWriter без
+        DataFrame конструкција; use_pandas=True го задржува стариот пат.
+        """
         if not events:
             self.logger.warning("Нема настани за зачувување")
             return ""
@@ -775,8 +1672,53 @@ class KartiEventsScraper:
         filepath = os.path.join(self.processed_data_dir, filename)
 
         try:
+            if use_pandas:
+                df = pd.DataFrame(events)
+                df.to_csv(filepath, index=False, encoding='utf-8-sig')
+            else:
+                # Унија од сите клучеви - редовите немаат иста шема
+                fieldnames = sorted({k for e in events for k in e})
+                with open(filepath, 'w', encoding='utf-8-sig', newline='') as f:
+                    writer = csv.DictWriter(f, fieldnames=fieldnames,
+                                            quoting=csv.QUOTE_MINIMAL, restval='')
+                    writer.writeheader()
+
+                    # None/NaN -> '' како кај pandas writer-от, инаку
+                    # csv модулот ги пишува како 'None'/'nan' стрингови
+                    def clean_row(event):
+                        return {k: '' if v is None or (isinstance(v, float) and v != v)
+                                else v for k, v in event.items()}
+
+                    # Batch запис во парчиња од 1000 редови
+                    for start in range(0, len(events), 1000):
+                        writer.writerows(
+                            [clean_row(e) for e in events[start:start + 1000]])
+
+            self.logger.info(f"💾 Зачувани {len(events)} настани во: {filepath}")
+            return filepath
+        except Exception as e:
+            self.logger.error(f"❌ Грешка при зачувување: {e}")
+            return ""
+
+    def save_to_parquet(self, events: List[Dict], filename_suffix: str = "") -> str:
+        """Зачувај ги настаните во Parquet (zstd) - побрз I/O од CSV"""
+        if not events:
+            self.logger.warning("Нема настани за зачувување")
+            return ""
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if filename_suffix:
+            filename = f"karti_events_{filename_suffix}_{timestamp}.parquet"
+        else:
+            filename = f"karti_events_{timestamp}.parquet"
+
+        filepath = os.path.join(self.processed_data_dir, filename)
+
+        try:
+            # DataFrame-от се гради еднаш од целата листа (колонарно),
+            # не ред-по-ред
             df = pd.DataFrame(events)
-            df.to_csv(filepath, index=False, encoding='utf-8-sig')
+            df.to_parquet(filepath, compression='zstd')
             self.logger.info(f"💾 Зачувани {len(events)} настани во: {filepath}")
             return filepath
         except Exception as e:
@@ -792,15 +1734,24 @@ class KartiEventsScraper:
         self.logger.info(f"\n📊 === РЕЗИМЕ ===")
         self.logger.info(f"Вкупно настани: {len(events)}")
 
-        # Статистики
-        with_description = sum(1 for e in events if e.get('description') and len(e['description']) > 50)
-        with_organizer = sum(1 for e in events if e.get('organizer'))
-        with_price = sum(1 for e in events if e.get('ticket_price_text'))
-        with_parsed_price = sum(1 for e in events if e.get('parsed_price'))
-        with_parsed_time = sum(1 for e in events if e.get('parsed_time'))
-        with_venue = sum(1 for e in events if e.get('venue'))
-        with_contact = sum(1 for e in events if e.get('contact_info') or e.get('parsed_contact'))
-        free_events = sum(1 for e in events if e.get('ticket_free'))
+        # Статистики - еден DataFrame, сите броења векторизирани наместо
+        # 8 Python поминувања низ листата
+        df = pd.DataFrame(events)
+
+        def _col(name, default=''):
+            if name in df.columns:
+                return df[name].fillna(default)
+            return pd.Series([default] * len(df))
+
+        with_description = int((_col('description').str.len() > 50).sum())
+        with_organizer = int(_col('organizer').astype(bool).sum())
+        with_price = int(_col('ticket_price_text').astype(bool).sum())
+        with_parsed_price = int(_col('parsed_price').astype(bool).sum())
+        with_parsed_time = int(_col('parsed_time').astype(bool).sum())
+        with_venue = int(_col('venue').astype(bool).sum())
+        with_contact = int((_col('contact_info').astype(bool)
+                            | _col('parsed_contact').astype(bool)).sum())
+        free_events = int(_col('ticket_free', False).astype(bool).sum())
 
         self.logger.info(f"Со опис: {with_description}")
         self.logger.info(f"Со организатор: {with_organizer}")
@@ -811,21 +1762,26 @@ class KartiEventsScraper:
         self.logger.info(f"Со контакт: {with_contact}")
         self.logger.info(f"Бесплатни: {free_events}")
 
+        def _tally(series):
+            # Integer-енкодирани категории + компајлиран bincount кога
+            # има Numba; инаку value_counts
+            if HAS_NUMBA:
+                cat = pd.Categorical(series)
+                counts = _count_codes(cat.codes.astype(np.int64),
+                                      len(cat.categories))
+                return dict(zip(cat.categories, counts.tolist()))
+            return series.value_counts().to_dict()
+
         # Категории
-        categories = {}
-        for event in events:
-            cat = event.get('category', 'Непознато')
-            categories[cat] = categories.get(cat, 0) + 1
+        categories = _tally(_col('category', 'Непознато').replace('', 'Непознато'))
 
         self.logger.info(f"\nКатегории:")
         for cat, count in categories.items():
             self.logger.info(f"  {cat}: {count}")
 
         # Парсирани типови настани
-        parsed_types = {}
-        for event in events:
-            p_type = event.get('parsed_event_type', 'Непознато')
-            parsed_types[p_type] = parsed_types.get(p_type, 0) + 1
+        parsed_types = _tally(
+            _col('parsed_event_type', 'Непознато').replace('', 'Непознато'))
 
         if any(t != 'Непознато' for t in parsed_types.keys()):
             self.logger.info(f"\nПарсирани типови:")
@@ -848,8 +1804,12 @@ class KartiEventsScraper:
                 self.logger.info(f"   🎭 Тип: {event.get('parsed_event_type')}")
             self.logger.info(f"   🔗 URL: {event.get('url', 'Без URL')}")
 
-    def run_full_scrape(self, max_load_attempts: int = 3, save_results: bool = True) -> List[Dict]:
-        """Изврши целосно скрепирање"""
+    def run_full_scrape(self, max_load_attempts: int = 3, save_results: bool = True,
+                        save_format: str = "csv") -> List[Dict]:
+        """Изврши целосно скрепирање
+
+        save_format: "csv" (default) или "parquet" за zstd Arrow output.
+        """
         try:
             self.logger.info("🚀 === ЗАПОЧНУВАМ СКРЕПИРАЊЕ ===")
 
@@ -859,13 +1819,26 @@ class KartiEventsScraper:
             # Скрепирај
             events = self.scrape_events(max_load_attempts)
 
-            # Зачувај ако е потребно
+            # Дедупликација еднаш овде - save/summary работат врз
+            # веќе исчистена листа
+            events = self._dedupe_by_url(events)
+
+            # Зачувај ако е потребно - CSV е default (downstream
+            # pipeline-от чита *.csv), Parquet само експлицитно
             if save_results and events:
-                self.save_to_csv(events, "final")
+                if save_format == "parquet" and HAS_PYARROW:
+                    self.save_to_parquet(events, "final")
+                else:
+                    if save_format == "parquet":
+                        self.logger.warning("⚠️ Нема pyarrow - зачувувам CSV")
+                    self.save_to_csv(events, "final")
 
             # Прикажи резиме
             self.print_summary(events)
 
+            if self._selector_hits:
+                self.logger.debug(f"📊 Description селектор погодоци: {self._selector_hits}")
+
             self.logger.info("✅ === СКРЕПИРАЊЕТО ЗАВРШЕНО ===")
             return events
 
@@ -917,15 +1890,64 @@ def main():
 
 
 # Дополнителни utility функции
+
+# Pool од driver-и за utility повици - Chrome startup (~1-2s)
+# се плаќа само на првиот повик по процес
+_DRIVER_POOL: queue.Queue = queue.Queue()
+
+
+def _drain_driver_pool():
+    """Изгаси ги pool driver-ите при излез од процесот"""
+    while True:
+        try:
+            driver = _DRIVER_POOL.get_nowait()
+        except queue.Empty:
+            break
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
+atexit.register(_drain_driver_pool)
+
+
 def scrape_single_event(url: str) -> Dict:
-    """Скрепирај еден конкретен настан"""
+    """Скрепирај еден конкретен настан
+
+    Driver-от се зема/враќа од module pool наместо нов Chrome по повик.
+    """
     scraper = KartiEventsScraper(debug=True)
     try:
+        scraper.driver = _DRIVER_POOL.get_nowait()
+        try:
+            # Исчисти состојба од претходниот URL
+            scraper.driver.delete_all_cookies()
+        except Exception:
+            # Расипан driver - изгаси го, не оставај Chrome процес
+            try:
+                scraper.driver.quit()
+            except Exception:
+                pass
+            scraper.driver = None
+    except queue.Empty:
+        pass
+
+    if scraper.driver is None:
         scraper.setup_driver()
+
+    try:
         details = scraper.scrape_event_details(url)
-        return details
-    finally:
+    except Exception:
+        # Driver-от може да е заглавен - затвори наместо назад во pool
         scraper.close_driver()
+        scraper.driver = None
+        raise
+
+    # Назад во pool само по успешен scrape
+    _DRIVER_POOL.put(scraper.driver)
+    scraper.driver = None
+    return details
 
 
 def test_selectors():